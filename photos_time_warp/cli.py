@@ -1,14 +1,17 @@
 """ Fix time / date / timezone for photos in Apple Photos """
 
+# many of the imports (osxphotos, photoscript, pyobjc) are slow to load so they're done
+# in the functions that need them; this keeps --help and --version fast
+from __future__ import annotations
+
 import datetime
-import os
 import pathlib
 import sys
-from functools import partial
+from contextlib import nullcontext
 from textwrap import dedent
+from typing import TYPE_CHECKING
 
 import click
-import pytimeparse
 from cloup import (
     Command,
     Context,
@@ -28,28 +31,25 @@ from cloup.constraints import (
     RequireExactly,
     mutually_exclusive,
 )
-from osxphotos.exiftool import get_exiftool_path
-from photoscript import Photo, PhotosLibrary
 from rich.console import Console
 from rich.themes import Theme
-from rich.traceback import install
 
 from ._version import __version__
 from .color_themes import color_themes
-from .compare_exif import PhotoCompare
-from .darkmode import is_dark_mode
 from .datetime_utils import datetime_naive_to_local, datetime_to_new_tz
-from .exif_updater import ExifUpdater
-from .photosalbum import PhotosAlbum
-from .phototz import PhotoTimeZone, PhotoTimeZoneUpdater
 from .timeutils import (
+    parse_time_offset,
     time_string_to_datetime,
     update_datetime,
     utc_offset_string_to_seconds,
 )
-from .timezones import Timezone
 from .utils import pluralize
 
+if TYPE_CHECKING:
+    from photoscript import Photo
+
+    from .timezones import Timezone
+
 # name of the script
 APP_NAME = "photos_time_warp"
 
@@ -73,7 +73,27 @@ DATETIME_FORMAT = "%Y-%m-%d %H:%M:%S%z"
 def verbose(message_str, **kwargs):
     if not _verbose:
         return
-    _console.print(message_str, **kwargs)
+    if kwargs or "[" in message_str:
+        _console.print(message_str, **kwargs)
+    else:
+        # no markup or style to render so bypass rich
+        _console.file.write(f"{message_str}\n")
+
+
+def format_datetime(dt: datetime.datetime) -> str:
+    """Format dt as DATETIME_FORMAT; equivalent to dt.strftime(DATETIME_FORMAT) but
+    faster as it avoids strftime parsing the format string on every call"""
+    date_str = (
+        f"{dt.year:04d}-{dt.month:02d}-{dt.day:02d} "
+        f"{dt.hour:02d}:{dt.minute:02d}:{dt.second:02d}"
+    )
+    utcoffset = dt.utcoffset()
+    if utcoffset is None:
+        return date_str
+    offset_minutes = int(utcoffset.total_seconds()) // 60
+    sign = "-" if offset_minutes < 0 else "+"
+    hours, minutes = divmod(abs(offset_minutes), 60)
+    return f"{date_str}{sign}{hours:02d}{minutes:02d}"
 
 
 def print_help_msg(command):
@@ -96,6 +116,11 @@ def echo(message):
     _console.print(message)
 
 
+def echo_plain(message):
+    """print to stdout (or --output-file) without rich; use for output with no markup"""
+    _console.file.write(f"{message}\n")
+
+
 requires_one = RequireExactly(1).rephrased(
     help="requires one",
     error=f"it must be used with:\n" f"{ErrorFmt.param_list}",
@@ -109,8 +134,8 @@ class DateTimeISO8601(click.ParamType):
 
     def convert(self, value, param, ctx):
         try:
-            return datetime.datetime.fromisoformat(value)
-        except Exception:
+            return datetime.datetime.fromisoformat(value.strip())
+        except ValueError:
             self.fail(
                 f"Invalid datetime format: {value}. "
                 "Valid format for datetime: 'YYYY-MM-DD[*HH[:MM[:SS[.fff[fff]]]][+HH:MM[:SS[.ffffff]]]]'"
@@ -138,19 +163,20 @@ class DateOffset(click.ParamType):
     name = "DATEOFFSET"
 
     def convert(self, value, param, ctx):
-        offset = pytimeparse.parse(value)
-        if offset is not None:
-            offset = offset / 86400
-            return datetime.timedelta(days=offset)
-
-        # could be in format "-1" (negative offset) or "+1" (positive offset)
+        # most common format is "-1" (negative offset) or "+1" (positive offset) so try that first;
+        # parse_time_offset() doesn't accept numbers without units so the order doesn't change the result
         try:
             return datetime.timedelta(days=int(value))
         except ValueError:
+            pass
+
+        offset = parse_time_offset(value)
+        if offset is None:
             self.fail(
                 f"Invalid date offset format: {value}. "
                 "Valid format for date/time offset: '±D days', '±W weeks', '±D' where D is days "
             )
+        return datetime.timedelta(days=offset / 86400)
 
 
 class TimeOffset(click.ParamType):
@@ -159,18 +185,19 @@ class TimeOffset(click.ParamType):
     name = "TIMEOFFSET"
 
     def convert(self, value, param, ctx):
-        offset = pytimeparse.parse(value)
-        if offset is not None:
-            return datetime.timedelta(seconds=offset)
-
         # could be in format "-18000" (negative offset) or "+18000" (positive offset)
         try:
             return datetime.timedelta(seconds=int(value))
         except ValueError:
+            pass
+
+        offset = parse_time_offset(value)
+        if offset is None:
             self.fail(
                 f"Invalid time offset format: {value}. "
                 "Valid format for date/time offset: '±HH:MM:SS', '±H hours' (or hr), '±M minutes' (or min), '±S seconds' (or sec), '±S' (where S is seconds)"
             )
+        return datetime.timedelta(seconds=offset)
 
 
 class UTCOffset(click.ParamType):
@@ -179,9 +206,11 @@ class UTCOffset(click.ParamType):
     name = "UTC_OFFSET"
 
     def convert(self, value, param, ctx):
+        from .timezones import timezone_for_offset
+
         try:
             offset_seconds = utc_offset_string_to_seconds(value)
-            return Timezone(offset_seconds)
+            return timezone_for_offset(offset_seconds)
         except Exception:
             self.fail(
                 f"Invalid timezone format: {value}. "
@@ -232,54 +261,63 @@ def update_photo_date_time(
     time_delta,
 ):
     """Update date, time in photo"""
+    if date is None and time is None and date_delta is None and time_delta is None:
+        return
+
     photo_date = photo.date
     new_photo_date = update_datetime(
         photo_date, date=date, time=time, date_delta=date_delta, time_delta=time_delta
     )
-    filename = photo.filename
-    uuid = photo.uuid
+    # check _verbose before calling verbose() to avoid formatting messages that won't be printed
     if new_photo_date != photo_date:
         photo.date = new_photo_date
+        if _verbose:
+            verbose(
+                f"Updated date/time for photo [filename]{photo.filename}[/filename] "
+                f"([uuid]{photo.uuid}[/uuid]) from: [time]{photo_date}[/time] to [time]{new_photo_date}[/time]"
+            )
+    elif _verbose:
         verbose(
-            f"Updated date/time for photo [filename]{filename}[/filename] "
-            f"([uuid]{uuid}[/uuid]) from: [time]{photo_date}[/time] to [time]{new_photo_date}[/time]"
-        )
-    else:
-        verbose(
-            f"Skipped date/time update for photo [filename]{filename}[/filename] "
-            f"([uuid]{uuid}[/uuid]): nothing to do"
+            f"Skipped date/time update for photo [filename]{photo.filename}[/filename] "
+            f"([uuid]{photo.uuid}[/uuid]): nothing to do"
         )
 
 
 def update_photo_time_for_new_timezone(
-    library_path: str,
     photo: Photo,
+    old_timezone: int,
     new_timezone: Timezone,
 ):
     """Update time in photo to keep it the same time but in a new timezone
 
     For example, photo time is 12:00+0100 and new timezone is +0200,
     so adjust photo time by 1 hour so it will now be 12:00+0200 instead of
-    13:00+0200 as it would be with no adjustment to the time"""
-    old_timezone = PhotoTimeZone(library_path=library_path).get_timezone(photo)[0]
+    13:00+0200 as it would be with no adjustment to the time
+
+    Args:
+        photo: Photo to update
+        old_timezone: current timezone offset of photo in seconds
+        new_timezone: Timezone the photo will be moved to
+    """
     # need to move time in opposite direction of timezone offset so that
     # photo time is the same time but in the new timezone
     delta = old_timezone - new_timezone.offset
     photo_date = photo.date
-    new_photo_date = update_datetime(
-        dt=photo_date, time_delta=datetime.timedelta(seconds=delta)
+    new_photo_date = (
+        update_datetime(dt=photo_date, time_delta=datetime.timedelta(seconds=delta))
+        if delta
+        else photo_date
     )
-    filename = photo.filename
-    uuid = photo.uuid
     if photo_date != new_photo_date:
         photo.date = new_photo_date
+        if _verbose:
+            verbose(
+                f"Adjusted date/time for photo [filename]{photo.filename}[/filename] ([uuid]{photo.uuid}[/uuid]) to match "
+                f"previous time [time]{photo_date}[time] but in new timezone [tz]{new_timezone}[/tz]."
+            )
+    elif _verbose:
         verbose(
-            f"Adjusted date/time for photo [filename]{filename}[/filename] ([uuid]{uuid}[/uuid]) to match "
-            f"previous time [time]{photo_date}[time] but in new timezone [tz]{new_timezone}[/tz]."
-        )
-    else:
-        verbose(
-            f"Skipping date/time update for photo [filename]{filename}[/filename] ([uuid]{photo.uuid}[/uuid]), "
+            f"Skipping date/time update for photo [filename]{photo.filename}[/filename] ([uuid]{photo.uuid}[/uuid]), "
             f"already matches new timezone [tz]{new_timezone}[/tz]"
         )
 
@@ -305,6 +343,8 @@ def get_theme(dark, light, mono, plain):
             sys.exit(1)
     elif theme_name == "default":
         # try to auto-detect dark/light mode
+        from .darkmode import is_dark_mode
+
         theme = color_themes["dark"] if is_dark_mode() else color_themes["light"]
     else:
         theme = color_themes[theme_name]
@@ -552,11 +592,16 @@ def cli(
     """
 
     # install rich traceback output
+    from rich.traceback import install
+
     install(show_locals=True)
 
     # used to control whether to print out verbose output
     global _verbose
     _verbose = verbose_
+    # helper classes default to a no-op if not passed a verbose function so don't
+    # pass verbose() unless needed, which saves a call per message when not verbose
+    verbose_func = verbose if verbose_ else None
 
     # if config dir doesn't exist, create it
     config_dir = CONFIG_DIR.expanduser()
@@ -567,11 +612,24 @@ def cli(
     configure_console(theme, plain, terminal_width, output_file)
 
     if any([compare_exif, push_exif, pull_exif]):
+        # get_exiftool_path() is memoized by osxphotos so $PATH is only searched once per process
+        from osxphotos.exiftool import get_exiftool_path
+
         exiftool_path = exiftool_path or get_exiftool_path()
         verbose(f"exiftool path: [filename]{exiftool_path}[/filename]")
 
+    from .photosbatch import PhotosBatch
+    from .phototz import PhotoTimeZone, PhotoTimeZoneUpdater
+
     try:
-        photos = PhotosLibrary().selection
+        # photos_batch prefetches uuid/filename/date for all selected photos in one
+        # AppleScript call and batches any date changes; date changes are only batched
+        # if nothing else writes to the photo: the timezone and EXIF updates write
+        # straight to the database/file so each date must be written to Photos first
+        # to keep the same order (date, then timezone, then EXIF) for every photo
+        batch_dates = not any([timezone, pull_exif, push_exif])
+        photos_batch = PhotosBatch(chunk_size=50 if batch_dates else 1)
+        photos = photos_batch.selection
         if not photos:
             print_warning("No photos selected")
             sys.exit(0)
@@ -590,45 +648,62 @@ def cli(
             )
         sys.exit(1)
 
-    update_photo_date_time_ = partial(
-        update_photo_date_time,
-        date=date,
-        time=time,
-        date_delta=date_delta,
-        time_delta=time_delta,
-    )
-
-    update_photo_time_for_new_timezone_ = partial(
-        update_photo_time_for_new_timezone,
-        library_path=library,
+    # one PhotoTimeZone is shared by everything that needs to look up a photo's timezone
+    photo_tz = (
+        PhotoTimeZone(library_path=library)
+        if any([inspect, compare_exif, match_time, push_exif])
+        else None
     )
 
     if inspect:
-        tzinfo = PhotoTimeZone(library_path=library)
+        # in --plain mode there's no markup to render so rows are written directly
+        # instead of through rich which is slow for large selections
         if photos:
-            echo(
-                "[filename]filename[/filename], [uuid]uuid[/uuid], [time]photo time (local)[/time], [time]photo time[/time], [tz]timezone offset[/tz], [tz]timezone name[/tz]"
-            )
+            if plain:
+                echo_plain(
+                    "filename, uuid, photo time (local), photo time, timezone offset, timezone name"
+                )
+            else:
+                echo(
+                    "[filename]filename[/filename], [uuid]uuid[/uuid], [time]photo time (local)[/time], [time]photo time[/time], [tz]timezone offset[/tz], [tz]timezone name[/tz]"
+                )
         for photo in photos:
-            tz_seconds, tz_str, tz_name = tzinfo.get_timezone(photo)
+            tz_seconds, tz_str, tz_name = photo_tz.get_timezone(photo)
             photo_date_local = datetime_naive_to_local(photo.date)
             photo_date_tz = datetime_to_new_tz(photo_date_local, tz_seconds)
-            echo(
-                f"[filename]{photo.filename}[/filename], [uuid]{photo.uuid}[/uuid], [time]{photo_date_local.strftime(DATETIME_FORMAT)}[/time], [time]{photo_date_tz.strftime(DATETIME_FORMAT)}[/time], [tz]{tz_str}[/tz], [tz]{tz_name}[/tz]"
-            )
+            date_local = format_datetime(photo_date_local)
+            date_tz = format_datetime(photo_date_tz)
+            if plain:
+                echo_plain(
+                    f"{photo.filename}, {photo.uuid}, {date_local}, {date_tz}, {tz_str}, {tz_name}"
+                )
+            else:
+                echo(
+                    f"[filename]{photo.filename}[/filename], [uuid]{photo.uuid}[/uuid], [time]{date_local}[/time], [time]{date_tz}[/time], [tz]{tz_str}[/tz], [tz]{tz_name}[/tz]"
+                )
+        photo_tz.close()
         sys.exit(0)
 
     if compare_exif:
-        album = PhotosAlbum(add_to_album) if add_to_album else None
-        different_photos = 0
+        from .compare_exif import PhotoCompare
+        from .photosalbum import PhotosAlbum
+
+        album = (
+            PhotosAlbum(add_to_album, library=photos_batch.library)
+            if add_to_album
+            else None
+        )
+        # photos to add to album; added all at once after comparing
+        different_photos = []
         if photos:
             photocomp = PhotoCompare(
                 library_path=library,
-                verbose=verbose,
+                verbose=verbose_func,
                 exiftool_path=exiftool_path,
+                photo_tz=photo_tz,
             )
             if not album:
-                echo(
+                echo_plain(
                     "filename, uuid, photo time (Photos), photo time (EXIF), timezone offset (Photos), timezone offset (EXIF)"
                 )
         for photo in photos:
@@ -645,60 +720,85 @@ def cli(
                 )
             else:
                 filename = photo.filename
-            uuid = f"[uuid]{photo.uuid}[/uuid]"
+            uuid = photo.uuid if plain else f"[uuid]{photo.uuid}[/uuid]"
             if album:
                 if diff_results.diff:
-                    different_photos += 1
-                    verbose(
-                        f"Photo {filename} ({uuid}) has different date/time/timezone, adding to album '{album.name}'"
-                    )
-                    album.add(photo)
-                else:
+                    different_photos.append(photo)
+                    if _verbose:
+                        verbose(
+                            f"Photo {filename} ({uuid}) has different date/time/timezone, adding to album '{album.name}'"
+                        )
+                elif _verbose:
                     verbose(f"Photo {filename} ({uuid}) has same date/time/timezone")
             else:
-                echo(
+                # no markup in --plain mode, bypass rich
+                (echo_plain if plain else echo)(
                     f"{filename}, {uuid}, "
                     f"{diff_results.photos_date} {diff_results.photos_time}, {diff_results.exif_date} {diff_results.exif_time}, "
                     f"{diff_results.photos_tz}, {diff_results.exif_tz}"
                 )
         if album:
+            album.add_list(different_photos)
+            different_count = len(different_photos)
             echo(
-                f"Compared {len(photos)} photos, found {different_photos} "
-                f"that {pluralize(different_photos, 'is', 'are')} different and "
-                f"added {pluralize(different_photos, 'it', 'them')} to album '{album.name}'."
+                f"Compared {len(photos)} photos, found {different_count} "
+                f"that {pluralize(different_count, 'is', 'are')} different and "
+                f"added {pluralize(different_count, 'it', 'them')} to album '{album.name}'."
             )
+        photo_tz.close()
         sys.exit(0)
 
     if timezone:
         tz_updater = PhotoTimeZoneUpdater(
-            timezone, verbose=verbose, library_path=library
+            timezone, verbose=verbose_func, library_path=library
         )
 
     if any([push_exif, pull_exif]):
+        from .exif_updater import ExifUpdater
+
         exif_updater = ExifUpdater(
             library_path=library,
-            verbose=verbose,
+            verbose=verbose_func,
             exiftool_path=exiftool_path,
             plain=plain,
+            photo_tz=photo_tz,
         )
+    else:
+        exif_updater = nullcontext()
+
+    # loop invariant, don't need to evaluate for each photo
+    update_date_time = any([date, time, date_delta, time_delta])
 
     echo(f"Processing {len(photos)} {pluralize(len(photos), 'photo', 'photos')}")
-    # send progress bar output to /dev/null if verbose to hide the progress bar
-    fp = open(os.devnull, "w") if _verbose else None
-    with click.progressbar(photos, file=fp) as bar:
+    # don't show the progress bar if verbose as it would be interleaved with the verbose output
+    # and only redraw the bar about 100 times no matter how many photos are selected
+    progress = (
+        nullcontext(photos)
+        if _verbose
+        else click.progressbar(photos, update_min_steps=max(1, len(photos) // 100))
+    )
+    # photos are processed serially, not in a thread pool: NSAppleScript calls and the single
+    # exiftool -stay_open pipe are not thread safe and the Photos date writes are already
+    # batched by PhotosBatch so there's little latency left to overlap
+    with photos_batch, exif_updater, progress as bar:
         for p in bar:
             if pull_exif:
                 exif_updater.update_photos_from_exif(
                     p, use_file_modify_date=use_file_time
                 )
-            if any([date, time, date_delta, time_delta]):
-                update_photo_date_time_(p)
+            if update_date_time:
+                update_photo_date_time(p, date, time, date_delta, time_delta)
             if match_time:
                 # need to adjust time before the timezone is updated
                 # or the old timezone will be overwritten in the database
-                update_photo_time_for_new_timezone_(photo=p, new_timezone=timezone)
+                update_photo_time_for_new_timezone(
+                    p, photo_tz.get_timezone(p)[0], timezone
+                )
             if timezone:
                 tz_updater.update_photo(p)
+                if photo_tz:
+                    # cached timezone for p is now out of date
+                    photo_tz.clear_cache(p)
             if push_exif:
                 # this should be the last step in the if chain to ensure all Photos data is updated
                 # before exiftool is run
@@ -708,11 +808,14 @@ def cli(
                 if exif_error:
                     print_error(f"Error running exiftool: {exif_error}")
 
-    if fp is not None:
-        fp.close()
-
     echo("Done.")
 
+    # close the Photos database connections
+    if photo_tz:
+        photo_tz.close()
+    if timezone:
+        tz_updater.close()
+
     if output_file:
         output_file.close()
 
@@ -8,10 +8,12 @@ from rich.themes import Theme
 
 def add_rich_markup_tag(tag: str) -> str:
     """Add rich markup tags to string"""
+    # build the opening and closing tags once rather than for every message
+    open_tag, close_tag = f"[{tag}]", f"[/{tag}]"
 
     def add_tag(msg: str) -> str:
         """Add tag to string"""
-        return f"[{tag}]{msg}[/{tag}]"
+        return f"{open_tag}{msg}{close_tag}"
 
     return add_tag
 
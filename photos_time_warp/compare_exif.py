@@ -44,12 +44,14 @@ class PhotoCompare:
         library_path: Optional[str] = None,
         verbose: Optional[Callable] = None,
         exiftool_path: Optional[str] = None,
+        photo_tz: Optional[PhotoTimeZone] = None,
     ):
         self.library_path = library_path
         self.db = PhotosDB(self.library_path)
         self.verbose = verbose or noop
         self.exiftool_path = exiftool_path
-        self.phototz = PhotoTimeZone(self.library_path)
+        # photo_tz may be shared with the caller to avoid opening the database again
+        self.phototz = photo_tz or PhotoTimeZone(self.library_path)
 
     def compare_exif(self, photo: Photo) -> List[str]:
         """Compare date/time/timezone in Photos to the exif data
@@ -68,8 +70,8 @@ class PhotoCompare:
         photo_ = self.db.get_photo(photo.uuid)
         photo_path = photo_.path
         if photo_path:
-            exif = ExifTool(filepath=photo_path, exiftool=self.exiftool_path)
-            exif_dict = exif.asdict()
+            # ExifTool reads all tags when created; .data avoids a second exiftool run via asdict()
+            exif_dict = ExifTool(filepath=photo_path, exiftool=self.exiftool_path).data
             exif_dt_offset = get_exif_date_time_offset(exif_dict)
             exif_offset = exif_dt_offset.offset_str
             exif_date = (
@@ -3,6 +3,7 @@
 __version__ = "2021.10.8"
 
 import datetime
+from functools import lru_cache
 
 # TODO: probably shouldn't use replace here, see this:
 # https://stackoverflow.com/questions/13994594/how-to-add-timezone-into-a-naive-datetime-instance-in-python/13994611#13994611
@@ -167,14 +168,19 @@ def datetime_utc_to_local(dt: datetime.datetime) -> datetime.datetime:
     return dt.replace(tzinfo=datetime.timezone.utc).astimezone(tz=None)
 
 
+@lru_cache(maxsize=None)
+def _fixed_offset_tz(offset) -> datetime.timezone:
+    """Return datetime.timezone for offset of seconds from UTC; a photo library
+    will usually only have a handful of distinct offsets so these are cached"""
+    return datetime.timezone(datetime.timedelta(seconds=offset))
+
+
 def datetime_to_new_tz(dt: datetime.datetime, offset):
     """Convert datetime.datetime object from current timezone to new timezone with offset of seconds from UTC"""
     if not datetime_has_tz(dt):
         raise ValueError("dt must be timezone aware")
 
-    time_delta = datetime.timedelta(seconds=offset)
-    tz = datetime.timezone(time_delta)
-    return dt.astimezone(tz=tz)
+    return dt.astimezone(tz=_fixed_offset_tz(offset))
 
 
 def utc_offset_seconds(dt: datetime.datetime) -> int:
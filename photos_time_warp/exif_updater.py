@@ -19,7 +19,8 @@ from .datetime_utils import (
     datetime_utc_to_local,
 )
 from .phototz import PhotoTimeZone, PhotoTimeZoneUpdater
-from .timezones import Timezone, format_offset_time
+from .sqlite_native import Connection
+from .timezones import format_offset_time, timezone_for_offset
 from .utils import noop
 
 # date/time/timezone extracted from regex as a timezone aware datetime.datetime object
@@ -38,6 +39,45 @@ ExifDateTime = namedtuple(
 )
 
 
+# EXIF date/time in form "YYYY:MM:DD HH:MM:SS" and timezone offset in form "+HHMM"
+_EXIF_DATETIME_RE = re.compile(r"(\d{4}):(\d{2}):(\d{2}) (\d{2}:\d{2}:\d{2})")
+_EXIF_OFFSET_RE = re.compile(r"[+-]\d{4}")
+
+# patterns used by get_exif_date_time_offset() to pick apart the date/time string
+_DT_WITH_OFFSET_RE = re.compile(
+    r"\d{4}:\d{2}:\d{2}\s\d{2}:\d{2}:\d{2}([+-]\d{2}:\d{2})"
+)
+_DT_TIME_RE = re.compile(r"\d{4}:\d{2}:\d{2}\s(\d{2}:\d{2}:\d{2})")
+_DT_DATE_RE = re.compile(r"^(\d{4}:\d{2}:\d{2})")
+_OFFSET_TAIL_RE = re.compile(r"[+-]\d{2}:\d{2}$")
+
+
+def exif_datetime_to_datetime(
+    dt: str, offset: Optional[str] = None
+) -> datetime.datetime:
+    """Convert EXIF date/time string to datetime.datetime
+
+    Args:
+        dt: date/time in form "YYYY:MM:DD HH:MM:SS"
+        offset: optional timezone offset in form "+HHMM"
+
+    Returns:
+        datetime.datetime, timezone aware if offset is given
+
+    Raises:
+        ValueError if dt or offset is not valid
+    """
+    matched = _EXIF_DATETIME_RE.fullmatch(dt)
+    if matched and (offset is None or _EXIF_OFFSET_RE.fullmatch(offset)):
+        # the common case, fromisoformat is much faster than strptime
+        year, month, day, time_ = matched.groups()
+        tz = f"{offset[:3]}:{offset[3:]}" if offset else ""
+        return datetime.datetime.fromisoformat(f"{year}-{month}-{day}T{time_}{tz}")
+    if offset:
+        return datetime.datetime.strptime(f"{dt}{offset}", "%Y:%m:%d %H:%M:%S%z")
+    return datetime.datetime.strptime(dt, "%Y:%m:%d %H:%M:%S")
+
+
 def exif_offset_to_seconds(offset: str) -> int:
     """Convert timezone offset from UTC in exiftool format (+/-hh:mm) to seconds"""
     sign = 1 if offset[0] == "+" else -1
@@ -46,7 +86,13 @@ def exif_offset_to_seconds(offset: str) -> int:
 
 
 class ExifUpdater:
-    """Update exif data in photos"""
+    """Update exif data in photos
+
+    ExifTool runs a single exiftool process in -stay_open batch mode which is reused
+    for every photo and shared with any other ExifTool user in the process, so it's left
+    running and stopped by osxphotos at exit; use ExifUpdater as a context manager to close
+    the Photos database when done.
+    """
 
     def __init__(
         self,
@@ -54,13 +100,36 @@ class ExifUpdater:
         verbose: Optional[Callable] = None,
         exiftool_path: Optional[str] = None,
         plain=False,
+        photo_tz: Optional[PhotoTimeZone] = None,
     ):
         self.library_path = library_path
         self.db = PhotosDB(self.library_path)
         self.verbose = verbose or noop
         self.exiftool_path = exiftool_path
-        self.tzinfo = PhotoTimeZone(library_path=self.library_path)
+        # photo_tz may be shared with the caller to avoid opening the database again;
+        # it's only closed by close() if it was created here
+        self._owns_tzinfo = photo_tz is None
+        self.tzinfo = photo_tz or PhotoTimeZone(library_path=self.library_path)
         self.plain = plain
+        # PhotoTimeZoneUpdater for each timezone offset seen by update_photos_from_exif;
+        # these all share a single connection to the database, opened when first needed
+        self._tz_updaters: Dict[int, PhotoTimeZoneUpdater] = {}
+        self._tz_conn: Optional[Connection] = None
+
+    def close(self):
+        """Close the Photos database"""
+        self._tz_updaters = {}
+        if self._tz_conn:
+            self._tz_conn.close()
+            self._tz_conn = None
+        if self._owns_tzinfo:
+            self.tzinfo.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
 
     def filename_color(self, filename: str) -> str:
         """Colorize filename for display in verbose output"""
@@ -84,7 +153,9 @@ class ExifUpdater:
         if not _photo:
             raise ValueError(f"Photo {photo.uuid} not found")
 
-        if not _photo.path:
+        # PhotoInfo.path may have to look up the path so only access it once
+        photo_path = _photo.path
+        if not photo_path:
             self.verbose(
                 "Skipping EXIF update for missing photo "
                 f"[filename]{_photo.original_filename}[/filename] ([uuid]{_photo.uuid}[/uuid])"
@@ -101,7 +172,11 @@ class ExifUpdater:
         photo_date = datetime_to_new_tz(photo_date, timezone_offset)
 
         # exiftool expects format to "2015:01:18 12:00:00"
-        datetimeoriginal = photo_date.strftime("%Y:%m:%d %H:%M:%S")
+        # format once and slice out the date and time for the IPTC tags below
+        datetimeoriginal = (
+            f"{photo_date.year:04d}:{photo_date.month:02d}:{photo_date.day:02d} "
+            f"{photo_date.hour:02d}:{photo_date.minute:02d}:{photo_date.second:02d}"
+        )
 
         # exiftool expects format of "-04:00"
         offset = format_offset_time(timezone_offset)
@@ -120,9 +195,9 @@ class ExifUpdater:
         if _photo.isphoto:
             exif["EXIF:DateTimeOriginal"] = datetimeoriginal
             exif["EXIF:CreateDate"] = datetimeoriginal
-            dateoriginal = photo_date.strftime("%Y:%m:%d")
+            dateoriginal = datetimeoriginal[:10]
             exif["IPTC:DateCreated"] = dateoriginal
-            timeoriginal = photo_date.strftime(f"%H:%M:%S{offset}")
+            timeoriginal = f"{datetimeoriginal[11:]}{offset}"
             exif["IPTC:TimeCreated"] = timeoriginal
 
             exif["EXIF:OffsetTimeOriginal"] = offset
@@ -136,22 +211,20 @@ class ExifUpdater:
             creationdate = f"{datetimeoriginal}{offset}"
             exif["QuickTime:CreationDate"] = creationdate
 
-            # need to convert to UTC then back to formatted string
-            tzdate = datetime.datetime.strptime(creationdate, "%Y:%m:%d %H:%M:%S%z")
-            utcdate = datetime_tz_to_utc(tzdate)
+            # need to convert to UTC then back to formatted string;
+            # photo_date is already timezone aware so convert it directly
+            # instead of parsing creationdate back into a datetime
+            utcdate = datetime_tz_to_utc(photo_date)
             createdate = utcdate.strftime("%Y:%m:%d %H:%M:%S")
             exif["QuickTime:CreateDate"] = createdate
 
         self.verbose(
-            f"Writing EXIF data with exiftool to {self.filename_color(_photo.path)}"
+            f"Writing EXIF data with exiftool to {self.filename_color(photo_path)}"
         )
-        with ExifTool(filepath=_photo.path, exiftool=self.exiftool_path) as exiftool:
+        with ExifTool(filepath=photo_path, exiftool=self.exiftool_path) as exiftool:
+            # all values in exif are single strings
             for tag, val in exif.items():
-                if type(val) == list:
-                    for v in val:
-                        exiftool.setvalue(tag, v)
-                else:
-                    exiftool.setvalue(tag, val)
+                exiftool.setvalue(tag, val)
         return exiftool.warning, exiftool.error
 
     def update_photos_from_exif(
@@ -171,7 +244,9 @@ class ExifUpdater:
         if not _photo:
             raise ValueError(f"Photo {photo.uuid} not found")
 
-        if not _photo.path:
+        # PhotoInfo.path may have to look up the path so only access it once
+        photo_path = _photo.path
+        if not photo_path:
             self.verbose(
                 "Skipping EXIF update for missing photo "
                 f"[filename]{_photo.original_filename}[/filename] ([uuid]{_photo.uuid}[/uuid])"
@@ -184,7 +259,7 @@ class ExifUpdater:
         )
 
         dtinfo = self.get_date_time_offset_from_exif(
-            _photo.path, use_file_modify_date=use_file_modify_date
+            photo_path, use_file_modify_date=use_file_modify_date
         )
         if dtinfo.used_file_modify_date:
             self.verbose(
@@ -200,11 +275,21 @@ class ExifUpdater:
 
         if dtinfo.offset_seconds:
             # update timezone then update date/time
-            timezone = Timezone(dtinfo.offset_seconds)
-            tzupdater = PhotoTimeZoneUpdater(
-                library_path=self.library_path, timezone=timezone
-            )
+            timezone = timezone_for_offset(dtinfo.offset_seconds)
+            try:
+                tzupdater = self._tz_updaters[dtinfo.offset_seconds]
+            except KeyError:
+                if self._tz_conn is None:
+                    self._tz_conn = Connection(self.tzinfo.db_path)
+                tzupdater = PhotoTimeZoneUpdater(
+                    library_path=self.library_path,
+                    timezone=timezone,
+                    connection=self._tz_conn,
+                )
+                self._tz_updaters[dtinfo.offset_seconds] = tzupdater
             tzupdater.update_photo(photo)
+            # cached timezone for photo is now out of date
+            self.tzinfo.clear_cache(photo)
             self.verbose(
                 "Updated timezone offset for photo "
                 f"[filename]{photo.filename}[/filename] ([uuid]{photo.uuid}[/uuid]): [tz]{timezone}[/tz]"
@@ -240,8 +325,9 @@ class ExifUpdater:
             ExifDateTime named tuple
 
         """
-        exiftool = ExifTool(filepath=photo_path, exiftool=self.exiftool_path)
-        exif = exiftool.asdict()
+        # ExifTool reads all tags when it's created so use those instead of calling asdict()
+        # which would run exiftool against the file a second time
+        exif = ExifTool(filepath=photo_path, exiftool=self.exiftool_path).data
         return get_exif_date_time_offset(
             exif, use_file_modify_date=use_file_modify_date
         )
@@ -297,14 +383,14 @@ def get_exif_date_time_offset(
     offset = exif.get("EXIF:OffsetTimeOriginal")
     if dt and not offset:
         # see if offset set in the dt string
-        matched = re.match(r"\d{4}:\d{2}:\d{2}\s\d{2}:\d{2}:\d{2}([+-]\d{2}:\d{2})", dt)
+        matched = _DT_WITH_OFFSET_RE.match(dt)
         offset = matched.group(1) if matched else None
 
     if dt:
         # make sure we have time
-        matched = re.match(r"\d{4}:\d{2}:\d{2}\s(\d{2}:\d{2}:\d{2})", dt)
+        matched = _DT_TIME_RE.match(dt)
         if not matched:
-            if matched := re.match(r"^(\d{4}:\d{2}:\d{2})", dt):
+            if matched := _DT_DATE_RE.match(dt):
                 # set time to 00:00:00
                 dt = f"{matched.group(1)} 00:00:00"
                 default_time = True
@@ -313,18 +399,14 @@ def get_exif_date_time_offset(
 
     if dt:
         if offset:
-            # drop offset from dt string and add it back on in datetime %z format
-            dt = re.sub(r"[+-]\d{2}:\d{2}$", "", dt)
+            # drop offset from dt string and pass it separately in +hhmm format
+            dt = _OFFSET_TAIL_RE.sub("", dt)
             offset = offset.replace(":", "")
-            dt = f"{dt}{offset}"
-            dt_format = "%Y:%m:%d %H:%M:%S%z"
-        else:
-            dt_format = "%Y:%m:%d %H:%M:%S"
 
         # convert to datetime
         # some files can have bad date/time data, (e.g. #24, Date/Time Original = 0000:00:00 00:00:00)
         try:
-            dt = datetime.datetime.strptime(dt, dt_format)
+            dt = exif_datetime_to_datetime(dt, offset)
         except ValueError:
             dt = None
 
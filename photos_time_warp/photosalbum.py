@@ -9,10 +9,23 @@ from .utils import noop, pluralize
 
 
 class PhotosAlbum:
-    def __init__(self, name: str, verbose: Optional[callable] = None):
+    def __init__(
+        self,
+        name: str,
+        verbose: Optional[callable] = None,
+        library: Optional[PhotosLibrary] = None,
+    ):
+        """Create PhotosAlbum
+
+        Args:
+            name: name of album; album will be created if it doesn't exist
+            verbose: optional callable for verbose output
+            library: optional PhotosLibrary to use; if not provided, a new one will be created
+                (creating a PhotosLibrary requires a round-trip to Photos)
+        """
         self.name = name
         self.verbose = verbose or noop
-        self.library = PhotosLibrary()
+        self.library = library or PhotosLibrary()
 
         album = self.library.album(name)
         if album is None:
@@ -22,12 +35,13 @@ class PhotosAlbum:
 
     def add(self, photo: Photo):
         self.album.add([photo])
-        self.verbose(
-            f"Added {photo.filename} ({photo.uuid}) to album {self.name}"
-        )
+        self.verbose(f"Added {photo.filename} ({photo.uuid}) to album {self.name}")
 
     def add_list(self, photo_list: List[Photo]):
-        for photolist in chunked(photo_list, 10):
+        if not photo_list:
+            return
+        # each chunk is a single AppleScript call
+        for photolist in chunked(photo_list, 100):
             self.album.add(photolist)
         photo_len = len(photo_list)
         self.verbose(
@@ -0,0 +1,116 @@
+""" PhotosBatch class to read and write the photos selected in Photos with batched AppleScript calls """
+
+import datetime
+from typing import Dict, List
+
+from applescript import AppleScript
+from photoscript import Photo, PhotosLibrary
+
+# Every photoscript property access (photo.date, photo.filename, ...) is a separate
+# AppleScript round-trip to Photos; these handlers work on the whole selection
+# (or a chunk of it) so the round-trip is paid once instead of once per photo per attribute
+_BATCH_SCRIPT = AppleScript(
+    """
+    on _batch_get_selection()
+        (* return {id, filename, date} of each selected item *)
+        set item_fields_ to {}
+        tell application "Photos"
+            set items_ to selection
+            repeat with item_ in items_
+                copy {id of item_, filename of item_, date of item_} to end of item_fields_
+            end repeat
+        end tell
+        return item_fields_
+    end _batch_get_selection
+
+    on _batch_set_dates(ids_, dates_)
+        (* set date of each item in ids_ to the matching date in dates_ *)
+        tell application "Photos"
+            repeat with i_ from 1 to count of ids_
+                set id_ to item i_ of ids_
+                set date_ to item i_ of dates_
+                set count_ to 0
+                repeat while count_ < 5
+                    set date of media item id (id_) to date_
+                    if date of media item id (id_) = date_ then
+                        exit repeat
+                    end if
+                    set count_ to count_ + 1
+                end repeat
+            end repeat
+        end tell
+    end _batch_set_dates
+    """
+)
+
+
+class BatchPhoto(Photo):
+    """photoscript.Photo with uuid, filename, and date prefetched by PhotosBatch;
+    setting date queues the change to be written by PhotosBatch"""
+
+    def __init__(
+        self, batch: "PhotosBatch", id_: str, filename: str, date: datetime.datetime
+    ):
+        # don't call Photo.__init__ as it makes several AppleScript calls to validate the id
+        self.id = id_
+        self._uuid = id_.split("/")[0]
+        self._filename = filename
+        self._date = date
+        self._batch = batch
+
+    @property
+    def filename(self):
+        """filename of photo"""
+        return self._filename
+
+    @property
+    def date(self):
+        """date of photo as timezone-naive datetime.datetime object"""
+        return self._date
+
+    @date.setter
+    def date(self, date):
+        """Set date of photo as timezone-naive datetime.datetime object"""
+        self._date = date
+        self._batch.set_date(self, date)
+
+
+class PhotosBatch:
+    """Read the selected photos from Photos in a single AppleScript call and
+    write date changes back in chunks of chunk_size photos
+
+    Use as a context manager to ensure any pending changes are written on exit.
+    """
+
+    def __init__(self, chunk_size: int = 50):
+        self.library = PhotosLibrary()
+        self.chunk_size = chunk_size
+        self._pending: Dict[str, datetime.datetime] = {}
+
+    @property
+    def selection(self) -> List[BatchPhoto]:
+        """List of BatchPhoto objects for currently selected photos or [] if no selection"""
+        return [
+            BatchPhoto(self, id_, filename, date)
+            for id_, filename, date in _BATCH_SCRIPT.call("_batch_get_selection")
+        ]
+
+    def set_date(self, photo: Photo, date: datetime.datetime):
+        """Queue date change for photo; changes are written once chunk_size photos are queued"""
+        self._pending[photo.id] = date
+        if len(self._pending) >= self.chunk_size:
+            self.flush()
+
+    def flush(self):
+        """Write all queued date changes to Photos"""
+        if not self._pending:
+            return
+        ids, dates = list(self._pending.keys()), list(self._pending.values())
+        self._pending = {}
+        _BATCH_SCRIPT.call("_batch_set_dates", ids, dates)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.flush()
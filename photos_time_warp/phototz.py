@@ -3,9 +3,10 @@
 # Ensure you have a backup before using!
 # You have been warned.
 
+import functools
 import pathlib
 import plistlib
-from typing import Optional, Tuple
+from typing import Dict, Optional, Tuple
 
 from osxphotos._constants import (
     _DB_TABLE_NAMES,
@@ -17,7 +18,7 @@ from osxphotos.utils import get_last_library_path, get_system_library_path
 from photoscript import Photo
 from tenacity import retry, stop_after_attempt, wait_exponential
 
-from .sqlite_native import execute, query
+from .sqlite_native import Connection, query
 from .timezones import Timezone
 from .utils import noop
 
@@ -36,10 +37,13 @@ def get_db_model_version(db_file):
         db_file, "SELECT MAX(Z_VERSION) AS Z_VERSION, Z_PLIST FROM Z_METADATA"
     )
     row = next(results)
+    # close the generator so the statement is finalized and the database closed now
+    results.close()
     plist = plistlib.loads(row.Z_PLIST)
     return plist["PLModelVersion"]
 
 
+@functools.lru_cache(maxsize=4)
 def get_photos_version(db_file):
     """Returns Photos version based on model version found in db_file
 
@@ -62,6 +66,30 @@ def get_photos_version(db_file):
         return 7
 
 
+def get_db_path_and_asset_table(library_path: Optional[str] = None) -> Tuple[str, str]:
+    """Returns path to Photos.sqlite and name of the asset table for a Photos library
+
+    Args:
+        library_path: path to Photos library; if None, uses the last opened (or system) library
+
+    Returns: tuple of (db_path, asset_table_name)
+
+    Raises:
+        FileNotFoundError if the Photos database can't be found
+    """
+    # get_last_library_path() returns the path to the last Photos library
+    # opened but sometimes (rarely) fails on some systems
+    try:
+        db_path = library_path or get_last_library_path() or get_system_library_path()
+    except Exception:
+        db_path = None
+    if not db_path:
+        raise FileNotFoundError("Could not find Photos database path")
+
+    db_path = str(pathlib.Path(db_path) / "database/Photos.sqlite")
+    photos_version = get_photos_version(db_path)
+    return db_path, _DB_TABLE_NAMES[photos_version]["ASSET"]
+
 
 def tz_to_str(tz_seconds: int) -> str:
     """convert timezone offset in seconds to string in form +00:00 (as offset from GMT)"""
@@ -75,76 +103,112 @@ def tz_to_str(tz_seconds: int) -> str:
 
 
 class PhotoTimeZone:
-    """Get timezone info for photos"""
+    """Get timezone info for photos
+
+    Keeps the Photos database open until close() is called; use as a context manager
+    to ensure the database is closed when done.
+    """
 
     def __init__(
         self,
         library_path: Optional[str] = None,
     ):
-        # get_last_library_path() returns the path to the last Photos library
-        # opened but sometimes (rarely) fails on some systems
-        try:
-            db_path = (
-                library_path or get_last_library_path() or get_system_library_path()
-            )
-        except Exception:
-            db_path = None
-        if not db_path:
-            raise FileNotFoundError("Could not find Photos database path")
+        self.db_path, self.ASSET_TABLE = get_db_path_and_asset_table(library_path)
+
+        # keep the database open and the query prepared as it's run for every photo
+        self._conn = Connection(self.db_path)
 
-        db_path = str(pathlib.Path(db_path) / "database/Photos.sqlite")
-        self.db_path = db_path
-        photos_version = get_photos_version(self.db_path)
-        self.ASSET_TABLE = _DB_TABLE_NAMES[photos_version]["ASSET"]
+        # cache lookups by uuid so repeated calls for the same photo don't re-query the database
+        self._timezones: Dict[str, Tuple[int, str, str]] = {}
 
     def get_timezone(self, photo: Photo) -> Tuple[int, str, str]:
         """Return (timezone_seconds, timezone_str, timezone_name) of photo"""
-        uuid = photo.uuid
+        try:
+            return self._timezones[photo.uuid]
+        except KeyError:
+            timezone = self._timezones[photo.uuid] = self._query_timezone(photo.uuid)
+            return timezone
+
+    def clear_cache(self, photo: Optional[Photo] = None):
+        """Clear cached timezone value for photo, e.g. after the timezone of the photo has been
+        updated, or all cached values if photo is None"""
+        if photo is None:
+            self._timezones = {}
+        else:
+            self._timezones.pop(photo.uuid, None)
+
+    def close(self):
+        """Close the Photos database"""
+        self._conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def _query_timezone(self, uuid: str) -> Tuple[int, str, str]:
+        """Query database for (timezone_seconds, timezone_str, timezone_name) of photo with uuid"""
         sql = f"""  SELECT 
                     ZADDITIONALASSETATTRIBUTES.ZTIMEZONEOFFSET, 
                     ZADDITIONALASSETATTRIBUTES.ZTIMEZONENAME
                     FROM ZADDITIONALASSETATTRIBUTES
                     JOIN {self.ASSET_TABLE} 
                     ON ZADDITIONALASSETATTRIBUTES.ZASSET = {self.ASSET_TABLE}.Z_PK
-                    WHERE {self.ASSET_TABLE}.ZUUID = '{uuid}' 
+                    WHERE {self.ASSET_TABLE}.ZUUID = ? 
             """
-        results = query(self.db_path, sql)
-        row = next(results)
+        row = self._conn.query(sql, (uuid,))[0]
         tz, tzname = (row.ZTIMEZONEOFFSET, row.ZTIMEZONENAME)
         tz_str = tz_to_str(tz)
         return tz, tz_str, tzname
 
 
 class PhotoTimeZoneUpdater:
-    """Update timezones for Photos objects"""
+    """Update timezones for Photos objects
+
+    Keeps the Photos database open until close() is called; use as a context manager
+    to ensure the database is closed when done.
+    """
 
     def __init__(
         self,
         timezone: Timezone,
         verbose: Optional[callable] = None,
         library_path: Optional[str] = None,
+        connection: Optional[Connection] = None,
     ):
+        """Create PhotoTimeZoneUpdater
+
+        Args:
+            timezone: Timezone to set for photos
+            verbose: optional callable for verbose output
+            library_path: optional path to Photos library
+            connection: optional Connection to the Photos database to use, e.g. to share one
+                connection between updaters for different timezones; if provided, the caller
+                is responsible for closing it
+        """
         self.timezone = timezone
         self.tz_offset = timezone.offset
         self.tz_name = timezone.name
 
         self.verbose = verbose or noop
 
-        # get_last_library_path() returns the path to the last Photos library
-        # opened but sometimes (rarely) fails on some systems
-        try:
-            db_path = (
-                library_path or get_last_library_path() or get_system_library_path()
-            )
-        except Exception:
-            db_path = None
-        if not db_path:
-            raise FileNotFoundError("Could not find Photos database path")
+        self.db_path, self.ASSET_TABLE = get_db_path_and_asset_table(library_path)
+
+        # keep the database open and the select/update prepared as they're run for every photo
+        self._owns_conn = connection is None
+        self._conn = connection or Connection(self.db_path)
 
-        db_path = str(pathlib.Path(db_path) / "database/Photos.sqlite")
-        self.db_path = db_path
-        photos_version = get_photos_version(self.db_path)
-        self.ASSET_TABLE = _DB_TABLE_NAMES[photos_version]["ASSET"]
+    def close(self):
+        """Close the Photos database unless the connection was passed in by the caller"""
+        if self._owns_conn:
+            self._conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
 
     def update_photo(self, photo: Photo):
         """Update the timezone of a photo in the database
@@ -172,19 +236,21 @@ class PhotoTimeZoneUpdater:
                         FROM ZADDITIONALASSETATTRIBUTES
                         JOIN {self.ASSET_TABLE} 
                         ON ZADDITIONALASSETATTRIBUTES.ZASSET = {self.ASSET_TABLE}.Z_PK
-                        WHERE {self.ASSET_TABLE}.ZUUID = '{uuid}' 
+                        WHERE {self.ASSET_TABLE}.ZUUID = ? 
                 """
-            results = query(self.db_path, sql)
-            row = next(results)
+            row = self._conn.query(sql, (uuid,))[0]
             z_opt = row.Z_OPT + 1
             z_pk = row.Z_PK
-            sql_update = f"""   UPDATE ZADDITIONALASSETATTRIBUTES
-                                SET Z_OPT={z_opt}, 
-                                ZTIMEZONEOFFSET={self.tz_offset}, 
-                                ZTIMEZONENAME='{self.tz_name}' 
-                                WHERE Z_PK={z_pk};
+            sql_update = """   UPDATE ZADDITIONALASSETATTRIBUTES
+                                SET Z_OPT=?, 
+                                ZTIMEZONEOFFSET=?, 
+                                ZTIMEZONENAME=? 
+                                WHERE Z_PK=?;
                         """
-            results = execute(self.db_path, sql_update)
+            # tz_name may be objc.pyobjc_unicode and sqlite_native binds by exact type
+            self._conn.execute(
+                sql_update, (z_opt, int(self.tz_offset), str(self.tz_name), z_pk)
+            )
             self.verbose(
                 f"Updated timezone for photo [filename]{photo.filename}[/filename] ([uuid]{photo.uuid}[/uuid]) "
                 + f"from [tz]{row.ZTIMEZONENAME}[/tz], offset=[tz]{row.ZTIMEZONEOFFSET}[/tz] "
@@ -10,136 +10,247 @@
 
 from collections import namedtuple
 from contextlib import contextmanager
+from functools import lru_cache
 from ctypes import byref, c_char_p, c_double, c_int, c_int64, c_void_p, cdll, string_at
 from sys import platform
 
 
-def query(db_file, sql, params=()):
-    libsqlite3 = cdll.LoadLibrary(
-        {"linux": "libsqlite3.so", "darwin": "libsqlite3.dylib"}[platform]
+# the library and ctypes setup is the same for every query so it's done once at import
+_libsqlite3 = cdll.LoadLibrary(
+    {"linux": "libsqlite3.so", "darwin": "libsqlite3.dylib"}[platform]
+)
+_libsqlite3.sqlite3_errstr.restype = c_char_p
+_libsqlite3.sqlite3_errmsg.restype = c_char_p
+_libsqlite3.sqlite3_column_name.restype = c_char_p
+_libsqlite3.sqlite3_column_double.restype = c_double
+_libsqlite3.sqlite3_column_int64.restype = c_int64
+_libsqlite3.sqlite3_column_blob.restype = c_void_p
+_libsqlite3.sqlite3_column_bytes.restype = c_int64
+_libsqlite3.sqlite3_bind_int64.argtypes = (c_void_p, c_int, c_int64)
+_libsqlite3.sqlite3_bind_double.argtypes = (c_void_p, c_int, c_double)
+SQLITE_ROW = 100
+SQLITE_DONE = 101
+SQLITE_TRANSIENT = -1
+SQLITE_OPEN_READWRITE = 0x00000002
+SQLITE_PREPARE_PERSISTENT = 0x01
+
+
+def _bind_text(pp_stmt, i, value):
+    # encode once and use the length of the encoded bytes, not of the str
+    value = value.encode("utf-8")
+    return _libsqlite3.sqlite3_bind_text(
+        pp_stmt, i, value, len(value), SQLITE_TRANSIENT
     )
-    libsqlite3.sqlite3_errstr.restype = c_char_p
-    libsqlite3.sqlite3_errmsg.restype = c_char_p
-    libsqlite3.sqlite3_column_name.restype = c_char_p
-    libsqlite3.sqlite3_column_double.restype = c_double
-    libsqlite3.sqlite3_column_int64.restype = c_int64
-    libsqlite3.sqlite3_column_blob.restype = c_void_p
-    libsqlite3.sqlite3_column_bytes.restype = c_int64
-    SQLITE_ROW = 100
-    SQLITE_DONE = 101
-    SQLITE_TRANSIENT = -1
-    SQLITE_OPEN_READWRITE = 0x00000002
-
-    bind = {
-        type(0): libsqlite3.sqlite3_bind_int64,
-        type(0.0): libsqlite3.sqlite3_bind_double,
-        type(""): lambda pp_stmt, i, value: libsqlite3.sqlite3_bind_text(
-            pp_stmt,
-            i,
-            value.encode("utf-8"),
-            len(value.encode("utf-8")),
-            SQLITE_TRANSIENT,
-        ),
-        type(b""): lambda pp_stmt, i, value: libsqlite3.sqlite3_bind_blob(
-            pp_stmt, i, value, len(value), SQLITE_TRANSIENT
-        ),
-        type(None): lambda pp_stmt, i, _: libsqlite3.sqlite3_bind_null(pp_stmt, i),
-    }
-
-    extract = {
-        1: libsqlite3.sqlite3_column_int64,
-        2: libsqlite3.sqlite3_column_double,
-        3: lambda pp_stmt, i: string_at(
-            libsqlite3.sqlite3_column_blob(pp_stmt, i),
-            libsqlite3.sqlite3_column_bytes(pp_stmt, i),
-        ).decode(),
-        4: lambda pp_stmt, i: string_at(
-            libsqlite3.sqlite3_column_blob(pp_stmt, i),
-            libsqlite3.sqlite3_column_bytes(pp_stmt, i),
-        ),
-        5: lambda pp_stmt, i: None,
-    }
-
-    def run(func, *args):
-        res = func(*args)
-        if res != 0:
-            raise Exception(libsqlite3.sqlite3_errstr(res).decode())
-
-    def run_with_db(db, func, *args):
-        if func(*args) != 0:
-            raise Exception(libsqlite3.sqlite3_errmsg(db).decode())
-
-    @contextmanager
-    def get_db(db_file):
-        db = c_void_p()
-        run(
-            libsqlite3.sqlite3_open_v2,
-            db_file.encode(),
-            byref(db),
-            SQLITE_OPEN_READWRITE,
-            None,
-        )
-        try:
-            yield db
-        finally:
-            run_with_db(db, libsqlite3.sqlite3_close, db)
-
-    @contextmanager
-    def get_pp_stmt(db, sql):
-        pp_stmt = c_void_p()
-        run_with_db(
-            db,
-            libsqlite3.sqlite3_prepare_v3,
-            db,
-            sql.encode(),
-            -1,
-            0,
-            byref(pp_stmt),
-            None,
+
+
+_bind = {
+    type(0): _libsqlite3.sqlite3_bind_int64,
+    type(0.0): _libsqlite3.sqlite3_bind_double,
+    type(""): _bind_text,
+    type(b""): lambda pp_stmt, i, value: _libsqlite3.sqlite3_bind_blob(
+        pp_stmt, i, value, len(value), SQLITE_TRANSIENT
+    ),
+    type(None): lambda pp_stmt, i, _: _libsqlite3.sqlite3_bind_null(pp_stmt, i),
+}
+
+# indexed by column type: SQLITE_INTEGER (1), SQLITE_FLOAT, SQLITE_TEXT, SQLITE_BLOB, SQLITE_NULL (5)
+_extract = (
+    None,
+    _libsqlite3.sqlite3_column_int64,
+    _libsqlite3.sqlite3_column_double,
+    lambda pp_stmt, i: string_at(
+        _libsqlite3.sqlite3_column_blob(pp_stmt, i),
+        _libsqlite3.sqlite3_column_bytes(pp_stmt, i),
+    ).decode(),
+    lambda pp_stmt, i: string_at(
+        _libsqlite3.sqlite3_column_blob(pp_stmt, i),
+        _libsqlite3.sqlite3_column_bytes(pp_stmt, i),
+    ),
+    lambda pp_stmt, i: None,
+)
+
+
+def _run(func, *args):
+    res = func(*args)
+    if res != 0:
+        raise Exception(_libsqlite3.sqlite3_errstr(res).decode())
+
+
+def _run_with_db(db, func, *args):
+    if func(*args) != 0:
+        raise Exception(_libsqlite3.sqlite3_errmsg(db).decode())
+
+
+def _open_db(db_file):
+    db = c_void_p()
+    _run(
+        _libsqlite3.sqlite3_open_v2,
+        db_file.encode(),
+        byref(db),
+        SQLITE_OPEN_READWRITE,
+        None,
+    )
+    return db
+
+
+def _prepare(db, sql, flags=0):
+    pp_stmt = c_void_p()
+    _run_with_db(
+        db,
+        _libsqlite3.sqlite3_prepare_v3,
+        db,
+        sql.encode(),
+        -1,
+        flags,
+        byref(pp_stmt),
+        None,
+    )
+    return pp_stmt
+
+
+@contextmanager
+def _get_db(db_file):
+    db = _open_db(db_file)
+    try:
+        yield db
+    finally:
+        _run_with_db(db, _libsqlite3.sqlite3_close, db)
+
+
+@contextmanager
+def _get_pp_stmt(db, sql):
+    pp_stmt = _prepare(db, sql)
+    try:
+        yield pp_stmt
+    finally:
+        _run_with_db(db, _libsqlite3.sqlite3_finalize, pp_stmt)
+
+
+def _bind_params(db, pp_stmt, params):
+    for i, param in enumerate(params):
+        _run_with_db(db, _bind[type(param)], pp_stmt, i + 1, param)
+
+
+# namedtuple() builds a new class each time it's called so cache the Row class by column names;
+# the same few queries are run many times so there are only a handful of distinct classes
+@lru_cache(maxsize=None)
+def _row_class(column_names):
+    return namedtuple("Row", column_names)
+
+
+def _row_constructor(pp_stmt):
+    return _row_class(
+        tuple(
+            _libsqlite3.sqlite3_column_name(pp_stmt, i).decode()
+            for i in range(0, _libsqlite3.sqlite3_column_count(pp_stmt))
         )
-        try:
-            yield pp_stmt
-        finally:
-            run_with_db(db, libsqlite3.sqlite3_finalize, pp_stmt)
+    )
 
-    with get_db(db_file) as db, get_pp_stmt(db, sql) as pp_stmt:
 
-        for i, param in enumerate(params):
-            run_with_db(db, bind[type(param)], pp_stmt, i + 1, param)
+def _step(pp_stmt, row_constructor):
+    while True:
+        res = _libsqlite3.sqlite3_step(pp_stmt)
+        if res == SQLITE_DONE:
+            break
+        if res != SQLITE_ROW:
+            raise Exception(_libsqlite3.sqlite3_errstr(res).decode())
 
-        row_constructor = namedtuple(
-            "Row",
-            (
-                libsqlite3.sqlite3_column_name(pp_stmt, i).decode()
-                for i in range(0, libsqlite3.sqlite3_column_count(pp_stmt))
-            ),
+        yield row_constructor(
+            *(
+                _extract[_libsqlite3.sqlite3_column_type(pp_stmt, i)](pp_stmt, i)
+                for i in range(0, len(row_constructor._fields))
+            )
         )
 
-        while True:
-            res = libsqlite3.sqlite3_step(pp_stmt)
-            if res == SQLITE_DONE:
-                break
-            if res != SQLITE_ROW:
-                raise Exception(libsqlite3.sqlite3_errstr(res).decode())
-
-            yield row_constructor(
-                *(
-                    extract[libsqlite3.sqlite3_column_type(pp_stmt, i)](pp_stmt, i)
-                    for i in range(0, len(row_constructor._fields))
+
+def _step_done(pp_stmt):
+    """step a statement that doesn't return rows (e.g. UPDATE) until it's done"""
+    while True:
+        res = _libsqlite3.sqlite3_step(pp_stmt)
+        if res == SQLITE_DONE:
+            return
+        if res != SQLITE_ROW:
+            raise Exception(_libsqlite3.sqlite3_errstr(res).decode())
+
+
+def query(db_file, sql, params=()):
+    with _get_db(db_file) as db, _get_pp_stmt(db, sql) as pp_stmt:
+        _bind_params(db, pp_stmt, params)
+        yield from _step(pp_stmt, _row_constructor(pp_stmt))
+
+
+class Connection:
+    """Persistent connection to a sqlite database which caches prepared statements
+
+    query() opens the database and compiles the SQL on every call;
+    use Connection when running the same statements many times (e.g. once per photo),
+    passing values with params so the SQL text is the same each time.
+    """
+
+    def __init__(self, db_file):
+        self._db = _open_db(db_file)
+        # sql: (pp_stmt, row_constructor)
+        self._statements = {}
+
+    def query(self, sql, params=()):
+        """Run sql with params and return list of rows
+
+        Unlike the module level query(), all rows are read before returning so that the
+        statement is reset and doesn't hold a read transaction open on the database
+        """
+        pp_stmt, row_constructor = self._get_pp_stmt(sql)
+        try:
+            _bind_params(self._db, pp_stmt, params)
+            if row_constructor is None:
+                _step_done(pp_stmt)
+                return []
+            return list(_step(pp_stmt, row_constructor))
+        finally:
+            _libsqlite3.sqlite3_reset(pp_stmt)
+            _libsqlite3.sqlite3_clear_bindings(pp_stmt)
+
+    def execute(self, sql, params=()):
+        """run a sql statement that might update the db"""
+        return self.query(sql, params) or None
+
+    def _get_pp_stmt(self, sql):
+        """Return (pp_stmt, row_constructor) for sql, preparing it if not already cached;
+        row_constructor is None if the statement doesn't return any columns"""
+        try:
+            return self._statements[sql]
+        except KeyError:
+            pp_stmt = _prepare(self._db, sql, SQLITE_PREPARE_PERSISTENT)
+            try:
+                row_constructor = (
+                    _row_constructor(pp_stmt)
+                    if _libsqlite3.sqlite3_column_count(pp_stmt)
+                    else None
                 )
-            )
+            except Exception:
+                # statement isn't cached so close() wouldn't finalize it
+                _libsqlite3.sqlite3_finalize(pp_stmt)
+                raise
+            self._statements[sql] = (pp_stmt, row_constructor)
+            return pp_stmt, row_constructor
 
+    def close(self):
+        """Finalize all cached statements and close the database"""
+        if self._db is None:
+            return
+        for pp_stmt, _ in self._statements.values():
+            _libsqlite3.sqlite3_finalize(pp_stmt)
+        self._statements = {}
+        _run_with_db(self._db, _libsqlite3.sqlite3_close, self._db)
+        self._db = None
 
-def execute(db_file, sql):
-    """run a sql statement that might update the db"""
+    def __enter__(self):
+        return self
 
-    # this is needed because if the generator returned by query isn't exhausted, the SQL statement doesn't actually get executed
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
 
-    results = query(db_file, sql)
-    rows = []
-    try:
-        for row in results:
-            rows.append(row)
-    except StopIteration:
-        pass
-    return rows or None
+    def __del__(self):
+        try:
+            self.close()
+        except Exception:
+            pass
@@ -1,7 +1,7 @@
 """Utilities for working with datetimes"""
 
 import datetime
-from typing import Optional
+from typing import Optional, Union
 
 import re
 
@@ -24,6 +24,117 @@ def utc_offset_string_to_seconds(utc_offset: str) -> int:
         raise ValueError(f"Invalid UTC offset format: {utc_offset}.")
 
 
+# units accepted by parse_time_offset: unit name -> (rank, seconds)
+# units must appear in order of decreasing rank, e.g. "1 day 2 hours" but not "2 hours 1 day"
+_TIME_OFFSET_UNITS = {
+    **{unit: (4, 7 * 24 * 60 * 60) for unit in ("w", "wk", "wks", "week", "weeks")},
+    **{unit: (3, 24 * 60 * 60) for unit in ("d", "dy", "dys", "day", "days")},
+    **{unit: (2, 60 * 60) for unit in ("h", "hr", "hrs", "hour", "hours")},
+    **{unit: (1, 60) for unit in ("m", "min", "mins", "minute", "minutes")},
+    **{unit: (0, 1) for unit in ("s", "sec", "secs", "second", "seconds")},
+}
+
+
+def _parse_clock_offset(clock: str, after_units: bool) -> Optional[Union[int, float]]:
+    """Parse a clock style offset ('D:HH:MM:SS', 'H:MM:SS', 'M:SS', or ':SS', seconds may have a
+    fractional part) and return seconds or None if clock can't be parsed
+
+    Args:
+        clock: the clock string
+        after_units: True if clock follows weeks/days units, in which case only 'H:MM:SS' is valid
+    """
+    parts = clock.split(":")
+    if len(parts) > 4 or (after_units and len(parts) != 3):
+        return None
+    secs, dot, fraction = parts[-1].partition(".")
+    if dot and not fraction.isdigit():
+        return None
+    head, *fields = parts[:-1]
+    if len(parts) == 2:
+        # ':SS' or 'M:SS' where M is at most 2 digits
+        head = head or "0"
+        if len(head) > 2:
+            return None
+    if not head.isdigit() or not all(
+        len(field) == 2 and field.isdigit() for field in [*fields, secs]
+    ):
+        return None
+    seconds = sum(
+        int(field) * multiplier
+        for field, multiplier in zip(
+            reversed([head, *fields, secs]), (1, 60, 60 * 60, 24 * 60 * 60)
+        )
+    )
+    return seconds + float(f"0.{fraction}") if fraction else seconds
+
+
+def parse_time_offset(value: str) -> Optional[Union[int, float]]:
+    """Parse a time offset string and return the offset in seconds or None if value can't be parsed
+
+    Accepts the same formats as pytimeparse: an optional sign followed by either a clock value
+    ('H:MM:SS[.fff]', 'D:HH:MM:SS', 'M:SS', ':SS') or one or more number/unit pairs in order
+    of weeks, days, hours, minutes, seconds (e.g. '1 week, 2 days', '-1 hour', '1h30m', '1.5 hours').
+    Weeks/days may also be followed by a 'H:MM:SS' clock value (e.g. '1 day 2:30:00').
+    A bare number without units (e.g. '1') is not parsed and returns None.
+    """
+    s = value.strip()
+    sign = 1
+    if s[:1] in ("+", "-"):
+        sign = -1 if s[0] == "-" else 1
+        s = s[1:].lstrip()
+    if not s:
+        return None
+
+    total = 0
+    last_rank = None
+    i, length = 0, len(s)
+    while i < length:
+        start = i
+        while i < length and (s[i].isdigit() or s[i] in ".:"):
+            i += 1
+        number = s[start:i]
+        if not number:
+            return None
+
+        if ":" in number:
+            # clock value must be the last thing in the string and can only follow weeks/days
+            if s[i:].strip() or (last_rank is not None and last_rank < 3):
+                return None
+            seconds = _parse_clock_offset(number, after_units=last_rank is not None)
+            if seconds is None:
+                return None
+            total += seconds
+            break
+
+        while i < length and s[i].isspace():
+            i += 1
+        start = i
+        while i < length and s[i].isalpha():
+            i += 1
+        unit = _TIME_OFFSET_UNITS.get(s[start:i].lower())
+        if unit is None:
+            return None
+        rank, multiplier = unit
+        if last_rank is not None and rank >= last_rank:
+            return None
+        last_rank = rank
+
+        try:
+            total += (float(number) if "." in number else int(number)) * multiplier
+        except ValueError:
+            return None
+
+        # skip whitespace and optional separator between number/unit pairs
+        while i < length and s[i].isspace():
+            i += 1
+        if i < length and s[i] in ",/":
+            i += 1
+        while i < length and s[i].isspace():
+            i += 1
+
+    return sign * total
+
+
 def update_datetime(
     dt: datetime.datetime,
     date: Optional[datetime.date] = None,
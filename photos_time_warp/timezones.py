@@ -1,5 +1,6 @@
 """Get list of valid timezones on macOS"""
 
+from functools import lru_cache
 from typing import Union
 
 import Foundation
@@ -11,6 +12,7 @@ def known_timezone_names():
     return Foundation.NSTimeZone.knownTimeZoneNames()
 
 
+@lru_cache(maxsize=256)
 def format_offset_time(offset: int) -> str:
     """Format offset time to exiftool format: -04:00"""
     sign = "-" if offset < 0 else "+"
@@ -32,6 +34,8 @@ class Timezone:
                 self._name = self.timezone.name()
             else:
                 raise TypeError("Timezone must be a string or an int")
+            # offset is read for every photo so look it up once instead of crossing the ObjC bridge each time
+            self._offset = self.timezone.secondsFromGMT()
 
     @property
     def name(self) -> str:
@@ -39,7 +43,7 @@ class Timezone:
 
     @property
     def offset(self) -> int:
-        return self.timezone.secondsFromGMT()
+        return self._offset
 
     @property
     def offset_str(self) -> str:
@@ -54,3 +58,12 @@ class Timezone:
 
     def __repr__(self):
         return self.name
+
+
+# the CLI and EXIF parsers only produce whole-minute ±HH:MM offsets, limited to ±23:59, so there
+# are at most 2879 unique values that can be cached; other offsets in seconds still work but
+# could evict those entries
+@lru_cache(maxsize=2880)
+def timezone_for_offset(offset: int) -> Timezone:
+    """Return Timezone for offset in seconds from GMT; returns the same Timezone object for the same offset"""
+    return Timezone(offset)
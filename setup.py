@@ -53,8 +53,8 @@ setup(
         "cloup>=0.11.0,<0.12.0",
         "osxphotos>=0.44.8",
         "photoscript>=0.1.4,<0.2.0",
+        "py-applescript>=1.0.2,<2.0.0",
         "pyobjc-core>=7.3,<9.0",
-        "pytimeparse>=1.1.8,<1.2.0",
         "rich>=10.6.0,<12.0.0",
         "tenacity>=8.0.1,<9.0.0",
     ],
@@ -1,19 +1,33 @@
+import functools
 import os
 import pathlib
-import tempfile
+import time
+
+# set timezone to avoid issues with comparing dates; conftest is imported before the
+# test modules and the packages they import so nothing has looked up the local timezone yet
+os.environ["TZ"] = "US/Pacific"
+time.tzset()
 
-import photoscript
 import pytest
-from applescript import AppleScript
-from photoscript.utils import ditto
+from click.testing import CliRunner
+
+from tests.config_catalina import TEST_LIBRARY
+
+# photoscript, py-applescript and osxphotos only import on macOS so they're imported
+# in the fixtures that need them; this lets the tests that don't need Photos run anywhere
 
 
+@functools.lru_cache(maxsize=1)
 def get_os_version():
     import platform
 
     # returns tuple containing OS version
     # e.g. 10.13.6 = (10, 13, 6)
-    version = platform.mac_ver()[0].split(".")
+    release = platform.mac_ver()[0]
+    if not release:
+        # not running on macOS
+        return ("", "", "")
+    version = release.split(".")
     if len(version) == 2:
         (ver, major) = version
         minor = "0"
@@ -28,16 +42,11 @@ def get_os_version():
     return (ver, major, minor)
 
 
-OS_VER = get_os_version()[1]
-if OS_VER == "15":
-    from tests.config_catalina import TEST_LIBRARY
-else:
-    TEST_LIBRARY = None
-    pytest.exit("This test suite currently only runs on MacOS Catalina ")
-
-
 def copy_photos_library(photos_library=TEST_LIBRARY, delay=0):
     """ copy the test library and open Photos, returns path to copied library """
+    from applescript import AppleScript
+    from photoscript.utils import ditto
+
     script = AppleScript(
         """
         tell application "Photos"
@@ -79,16 +88,33 @@ def copy_photos_library(photos_library=TEST_LIBRARY, delay=0):
     return dest
 
 
-@pytest.fixture(scope="session", autouse=True)
+@pytest.fixture(scope="session")
 def setup_photos_timewarp():
+    """Copy the test library and open it in Photos; used by the tests that need Photos"""
     copy_photos_library(delay=10)
 
 
 @pytest.fixture
 def photoslib():
+    import photoscript
+
     return photoscript.PhotosLibrary()
 
 
+@pytest.fixture(scope="module")
+def photosdb():
+    """PhotosDB for reading photo paths; loading the library is slow so it's only done once per module"""
+    from osxphotos import PhotosDB
+
+    return PhotosDB()
+
+
+@pytest.fixture(scope="module")
+def runner():
+    """CliRunner shared by the tests in a module"""
+    return CliRunner()
+
+
 @pytest.fixture
 def suspend_capture(pytestconfig):
     class suspend_guard:
@@ -104,10 +130,7 @@ def suspend_capture(pytestconfig):
     yield suspend_guard()
 
 @pytest.fixture
-def output_file():
+def output_file(tmp_path):
     """Create a temporary filename for writing output"""
-    tempdir = tempfile.gettempdir()
-    fd, filename = tempfile.mkstemp(dir=tempdir)
-    os.close(fd)
-    yield filename
-    os.remove(filename)
\ No newline at end of file
+    # tmp_path is unique to each test and cleaned up by pytest
+    return str(tmp_path / "output.txt")
\ No newline at end of file
@@ -1,39 +1,58 @@
 """ Tests which require user interaction to run """
 
 import os
-import time
+import subprocess
 
 import pytest
-from click.testing import CliRunner
-from osxphotos import PhotosDB
+
+from tests.conftest import get_os_version
+
+# skip the module, rather than fail on the macOS-only imports below, when not on Catalina
+# so that the tests that don't need Photos can still be run
+OS_VER = get_os_version()[1]
+if OS_VER != "15":
+    pytest.skip(
+        "This test suite currently only runs on MacOS Catalina",
+        allow_module_level=True,
+    )
+
 from osxphotos.exiftool import ExifTool
 
+from photos_time_warp.cli import cli
+from tests.config_catalina import CATALINA_PHOTOS_5 as TEST_DATA
 from tests.conftest import (
     copy_photos_library,
-    get_os_version,
+    output_file,
+    photosdb,
     photoslib,
+    runner,
     suspend_capture,
-    output_file,
 )
 from tests.parse_output import parse_compare_exif, parse_inspect_output
 
-# set timezone to avoid issues with comparing dates
-os.environ["TZ"] = "US/Pacific"
-time.tzset()
+# copy the test library and open it in Photos before any of these tests run
+pytestmark = pytest.mark.usefixtures("setup_photos_timewarp")
 
 TERMINAL_WIDTH = 250
 
-OS_VER = get_os_version()[1]
-if OS_VER == "15":
-    from tests.config_catalina import CATALINA_PHOTOS_5 as TEST_DATA
 
-else:
-    pytest.exit("This test suite currently only runs on MacOS Catalina ")
+def say(msg: str) -> None:
+    """Say message with text to speech; set PHOTOS_TIME_WARP_NO_SAY to disable"""
+    if os.environ.get("PHOTOS_TIME_WARP_NO_SAY"):
+        return
+    # run say directly rather than via the shell so msg doesn't need quoting
+    # and don't wait for it to finish so the prompt is shown while it's spoken
+    subprocess.Popen(["say", msg], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
 
 
-def say(msg: str) -> None:
-    """Say message with text to speech"""
-    os.system(f"say {msg}")
+def inspect_args(output_file: str) -> list:
+    """Return CLI args to write --inspect output for the selection to output_file"""
+    return ["--inspect", "--plain", "-o", output_file]
+
+
+def compare_exif_args(output_file: str) -> list:
+    """Return CLI args to write --compare-exif output for the selection to output_file"""
+    return ["--compare-exif", "--plain", "-o", output_file]
 
 
 def ask_user_to_make_selection(
@@ -50,6 +69,7 @@ def ask_user_to_make_selection(
     """
     # needs to be called with a suspend_capture fixture
     photo_or_video = "photo" if not video else "video"
+    expected_filename = TEST_DATA["filenames"][photo_name]
     tries = 0
     while tries < retry:
         with suspend_capture:
@@ -58,10 +78,7 @@ def ask_user_to_make_selection(
             input(f"\n{prompt}")
 
         selection = photoslib.selection
-        if (
-            len(selection) == 1
-            and selection[0].filename == TEST_DATA["filenames"][photo_name]
-        ):
+        if len(selection) == 1 and selection[0].filename == expected_filename:
             return True
         tries += 1
     return False
@@ -75,24 +92,18 @@ def test_select_pears(photoslib, suspend_capture):
     assert ask_user_to_make_selection(photoslib, suspend_capture, "pears")
 
 
-def test_inspect(photoslib, suspend_capture, output_file):
+def test_inspect(photoslib, suspend_capture, output_file, runner):
     """Test --inspect. NOTE: this test requires user interaction"""
-    from photos_time_warp.cli import cli
-
-    runner = CliRunner()
     result = runner.invoke(
-        cli, ["--inspect", "--plain", "-o", output_file], terminal_width=TERMINAL_WIDTH
+        cli, inspect_args(output_file), terminal_width=TERMINAL_WIDTH
     )
     assert result.exit_code == 0
     values = parse_inspect_output(output_file)
     assert TEST_DATA["inspect"]["expected"] == values
 
 
-def test_date(photoslib, suspend_capture):
+def test_date(photoslib, suspend_capture, runner):
     """Test --date"""
-    from photos_time_warp.cli import cli
-
-    runner = CliRunner()
     result = runner.invoke(
         cli,
         [
@@ -108,11 +119,10 @@ def test_date(photoslib, suspend_capture):
 
 
 @pytest.mark.parametrize("input_value,expected", TEST_DATA["date_delta"]["parameters"])
-def test_date_delta(photoslib, suspend_capture, input_value, expected, output_file):
+def test_date_delta(
+    photoslib, suspend_capture, input_value, expected, output_file, runner
+):
     """Test --date-delta"""
-    from photos_time_warp.cli import cli
-
-    runner = CliRunner()
     result = runner.invoke(
         cli,
         [
@@ -124,18 +134,15 @@ def test_date_delta(photoslib, suspend_capture, input_value, expected, output_fi
     )
     assert result.exit_code == 0
     result = runner.invoke(
-        cli, ["--inspect", "--plain", "-o", output_file], terminal_width=TERMINAL_WIDTH
+        cli, inspect_args(output_file), terminal_width=TERMINAL_WIDTH
     )
     output_values = parse_inspect_output(output_file)
     assert output_values[0].date_tz == expected
 
 
 @pytest.mark.parametrize("input_value,expected", TEST_DATA["time"]["parameters"])
-def test_time(photoslib, suspend_capture, input_value, expected, output_file):
+def test_time(photoslib, suspend_capture, input_value, expected, output_file, runner):
     """Test --time"""
-    from photos_time_warp.cli import cli
-
-    runner = CliRunner()
     result = runner.invoke(
         cli,
         [
@@ -149,18 +156,17 @@ def test_time(photoslib, suspend_capture, input_value, expected, output_file):
     # inspect to get the updated times
     # don't use photo.date as it will return local time instead of the time in the timezone
     result = runner.invoke(
-        cli, ["--inspect", "--plain", "-o", output_file], terminal_width=TERMINAL_WIDTH
+        cli, inspect_args(output_file), terminal_width=TERMINAL_WIDTH
     )
     output_values = parse_inspect_output(output_file)
     assert output_values[0].date_tz == expected
 
 
 @pytest.mark.parametrize("input_value,expected", TEST_DATA["time_delta"]["parameters"])
-def test_time_delta(photoslib, suspend_capture, input_value, expected, output_file):
+def test_time_delta(
+    photoslib, suspend_capture, input_value, expected, output_file, runner
+):
     """Test --time-delta"""
-    from photos_time_warp.cli import cli
-
-    runner = CliRunner()
     result = runner.invoke(
         cli,
         [
@@ -172,7 +178,7 @@ def test_time_delta(photoslib, suspend_capture, input_value, expected, output_fi
     )
     assert result.exit_code == 0
     result = runner.invoke(
-        cli, ["--inspect", "--plain", "-o", output_file], terminal_width=TERMINAL_WIDTH
+        cli, inspect_args(output_file), terminal_width=TERMINAL_WIDTH
     )
     output_values = parse_inspect_output(output_file)
     assert output_values[0].date_tz == expected
@@ -182,12 +188,15 @@ def test_time_delta(photoslib, suspend_capture, input_value, expected, output_fi
     "input_value,expected_date,expected_tz", TEST_DATA["time_zone"]["parameters"]
 )
 def test_time_zone(
-    photoslib, suspend_capture, input_value, expected_date, expected_tz, output_file
+    photoslib,
+    suspend_capture,
+    input_value,
+    expected_date,
+    expected_tz,
+    output_file,
+    runner,
 ):
     """Test --time-zone"""
-    from photos_time_warp.cli import cli
-
-    runner = CliRunner()
     result = runner.invoke(
         cli,
         [
@@ -199,7 +208,7 @@ def test_time_zone(
     )
     assert result.exit_code == 0
     result = runner.invoke(
-        cli, ["--inspect", "--plain", "-o", output_file], terminal_width=TERMINAL_WIDTH
+        cli, inspect_args(output_file), terminal_width=TERMINAL_WIDTH
     )
     output_values = parse_inspect_output(output_file)
     assert output_values[0].date_tz == expected_date
@@ -207,11 +216,8 @@ def test_time_zone(
 
 
 @pytest.mark.parametrize("expected", TEST_DATA["compare_exif"]["expected"])
-def test_compare_exif(photoslib, suspend_capture, expected, output_file):
+def test_compare_exif(photoslib, suspend_capture, expected, output_file, runner):
     """Test --compare-exif"""
-    from photos_time_warp.cli import cli
-
-    runner = CliRunner()
     result = runner.invoke(
         cli,
         [
@@ -230,11 +236,8 @@ def test_compare_exif(photoslib, suspend_capture, expected, output_file):
 @pytest.mark.parametrize(
     "expected,album", TEST_DATA["compare_exif_add_to_album"]["expected"]
 )
-def test_compare_exif_add_to_album(photoslib, suspend_capture, expected, album):
+def test_compare_exif_add_to_album(photoslib, suspend_capture, expected, album, runner):
     """Test --compare-exif --add-to-album"""
-    from photos_time_warp.cli import cli
-
-    runner = CliRunner()
     result = runner.invoke(
         cli,
         [
@@ -251,20 +254,91 @@ def test_compare_exif_add_to_album(photoslib, suspend_capture, expected, album):
     assert album in [album.name for album in photo.albums]
 
 
+def test_push_exif_2(photoslib, suspend_capture, output_file, runner):
+    """Test --push-exif"""
+    pre_test = TEST_DATA["push_exif"]["pre"]
+    post_test = TEST_DATA["push_exif"]["post"]
+
+    result = runner.invoke(
+        cli,
+        compare_exif_args(output_file),
+        terminal_width=TERMINAL_WIDTH,
+    )
+    output_values = parse_compare_exif(output_file)
+    assert output_values[0] == pre_test
+
+    result = runner.invoke(
+        cli,
+        [
+            "--push-exif",
+            "--plain",
+            "--verbose",
+        ],
+        terminal_width=TERMINAL_WIDTH,
+    )
+    assert result.exit_code == 0
+
+    result = runner.invoke(
+        cli,
+        compare_exif_args(output_file),
+        terminal_width=TERMINAL_WIDTH,
+    )
+    output_values = parse_compare_exif(output_file)
+    assert output_values[0] == post_test
+
+
+def test_pull_exif_1(photoslib, suspend_capture, output_file, runner):
+    """Test --pull-exif"""
+    pre_test = TEST_DATA["pull_exif_1"]["pre"]
+    post_test = TEST_DATA["pull_exif_1"]["post"]
+
+    # update the photo so we know if the data is updated
+    result = runner.invoke(
+        cli,
+        ["-z", "-0400", "-D", "+1 day", "-m", "-V", "--plain"],
+        terminal_width=TERMINAL_WIDTH,
+    )
+    assert result.exit_code == 0
+
+    result = runner.invoke(
+        cli,
+        compare_exif_args(output_file),
+        terminal_width=TERMINAL_WIDTH,
+    )
+    output_values = parse_compare_exif(output_file)
+    assert output_values[0] == pre_test
+
+    result = runner.invoke(
+        cli,
+        [
+            "--pull-exif",
+            "--plain",
+            "--verbose",
+        ],
+        terminal_width=TERMINAL_WIDTH,
+    )
+    assert result.exit_code == 0
+
+    result = runner.invoke(
+        cli,
+        compare_exif_args(output_file),
+        terminal_width=TERMINAL_WIDTH,
+    )
+    output_values = parse_compare_exif(output_file)
+    assert output_values[0] == post_test
+
+
 def test_select_sunflowers(photoslib, suspend_capture):
     """Force user to select the right photo for following tests"""
     assert ask_user_to_make_selection(photoslib, suspend_capture, "sunflowers")
 
 
 @pytest.mark.parametrize("expected", TEST_DATA["compare_exif_3"]["expected"])
-def test_compare_exif_3(photoslib, suspend_capture, expected, output_file):
+def test_compare_exif_3(photoslib, suspend_capture, expected, output_file, runner):
     """Test --compare-exif"""
-    from photos_time_warp.cli import cli
-
-    runner = CliRunner()
     result = runner.invoke(
         cli,
-        ["--compare-exif", "--plain", "-o", output_file],
+        compare_exif_args(output_file),
         terminal_width=TERMINAL_WIDTH,
     )
     assert result.exit_code == 0
@@ -273,11 +347,8 @@ def test_compare_exif_3(photoslib, suspend_capture, expected, output_file):
 
 
 @pytest.mark.parametrize("input_value,expected", TEST_DATA["match"]["parameters"])
-def test_match(photoslib, suspend_capture, input_value, expected, output_file):
+def test_match(photoslib, suspend_capture, input_value, expected, output_file, runner):
     """Test --timezone --match"""
-    from photos_time_warp.cli import cli
-
-    runner = CliRunner()
     result = runner.invoke(
         cli,
         [
@@ -290,17 +361,14 @@ def test_match(photoslib, suspend_capture, input_value, expected, output_file):
     )
     assert result.exit_code == 0
     result = runner.invoke(
-        cli, ["--inspect", "--plain", "-o", output_file], terminal_width=TERMINAL_WIDTH
+        cli, inspect_args(output_file), terminal_width=TERMINAL_WIDTH
     )
     output_values = parse_inspect_output(output_file)
     assert output_values[0].date_tz == expected
 
 
-def test_push_exif_missing_file():
+def test_push_exif_missing_file(runner):
     """Test --push-exif when an original file is missing"""
-    from photos_time_warp.cli import cli
-
-    runner = CliRunner()
     result = runner.invoke(
         cli, ["--push-exif", "--plain", "--verbose"], terminal_width=TERMINAL_WIDTH
     )
@@ -319,6 +387,7 @@ def test_select_pumpkins(photoslib, suspend_capture):
 )
 def test_push_exif_1(
     photoslib,
+    photosdb,
     match,
     tz_value,
     time_delta_value,
@@ -326,10 +395,9 @@ def test_push_exif_1(
     exif_date,
     exif_offset,
     output_file,
+    runner,
 ):
     """Test --timezone --match with --push-exif"""
-    from photos_time_warp.cli import cli
-
     cli_args = [
         "--timezone",
         tz_value,
@@ -341,128 +409,36 @@ def test_push_exif_1(
     if match:
         cli_args.append("--match-time")
 
-    runner = CliRunner()
     result = runner.invoke(cli, cli_args, terminal_width=TERMINAL_WIDTH)
     assert result.exit_code == 0
     result = runner.invoke(
-        cli, ["--inspect", "--plain", "-o", output_file], terminal_width=TERMINAL_WIDTH
+        cli, inspect_args(output_file), terminal_width=TERMINAL_WIDTH
     )
     output_values = parse_inspect_output(output_file)
     assert output_values[0].date_tz == expected_date
 
     photo = photoslib.selection[0]
     uuid = photo.uuid
-    path = PhotosDB().get_photo(uuid).path
-    exif = ExifTool(path)
-    exifdict = exif.asdict()
+    path = photosdb.get_photo(uuid).path
+    # ExifTool reads the tags when created so use .data rather than running exiftool again with asdict()
+    exifdict = ExifTool(path).data
     assert exifdict["EXIF:DateTimeOriginal"] == exif_date
     assert exifdict["EXIF:OffsetTimeOriginal"] == exif_offset
 
 
-def test_select_pears_2(photoslib, suspend_capture):
-    """Force user to select the right photo for following tests"""
-    assert ask_user_to_make_selection(photoslib, suspend_capture, "pears")
-
-
-def test_push_exif_2(photoslib, suspend_capture, output_file):
-    """Test --push-exif"""
-    pre_test = TEST_DATA["push_exif"]["pre"]
-    post_test = TEST_DATA["push_exif"]["post"]
-
-    from photos_time_warp.cli import cli
-
-    runner = CliRunner()
-
-    result = runner.invoke(
-        cli,
-        ["--compare-exif", "--plain", "-o", output_file],
-        terminal_width=TERMINAL_WIDTH,
-    )
-    output_values = parse_compare_exif(output_file)
-    assert output_values[0] == pre_test
-
-    result = runner.invoke(
-        cli,
-        [
-            "--push-exif",
-            "--plain",
-            "--verbose",
-        ],
-        terminal_width=TERMINAL_WIDTH,
-    )
-    assert result.exit_code == 0
-
-    result = runner.invoke(
-        cli,
-        ["--compare-exif", "--plain", "-o", output_file],
-        terminal_width=TERMINAL_WIDTH,
-    )
-    output_values = parse_compare_exif(output_file)
-    assert output_values[0] == post_test
-
-
-def test_pull_exif_1(photoslib, suspend_capture, output_file):
-    """Test --pull-exif"""
-    pre_test = TEST_DATA["pull_exif_1"]["pre"]
-    post_test = TEST_DATA["pull_exif_1"]["post"]
-
-    from photos_time_warp.cli import cli
-
-    runner = CliRunner()
-
-    # update the photo so we know if the data is updated
-    result = runner.invoke(
-        cli,
-        ["-z", "-0400", "-D", "+1 day", "-m", "-V", "--plain"],
-        terminal_width=TERMINAL_WIDTH,
-    )
-    assert result.exit_code == 0
-
-    result = runner.invoke(
-        cli,
-        ["--compare-exif", "--plain", "-o", output_file],
-        terminal_width=TERMINAL_WIDTH,
-    )
-    output_values = parse_compare_exif(output_file)
-    assert output_values[0] == pre_test
-
-    result = runner.invoke(
-        cli,
-        [
-            "--pull-exif",
-            "--plain",
-            "--verbose",
-        ],
-        terminal_width=TERMINAL_WIDTH,
-    )
-    assert result.exit_code == 0
-
-    result = runner.invoke(
-        cli,
-        ["--compare-exif", "--plain", "-o", output_file],
-        terminal_width=TERMINAL_WIDTH,
-    )
-    output_values = parse_compare_exif(output_file)
-    assert output_values[0] == post_test
-
-
 def test_select_apple_tree(photoslib, suspend_capture):
     """Force user to select the right photo for following tests"""
     assert ask_user_to_make_selection(photoslib, suspend_capture, "apple tree")
 
 
-def test_pull_exif_no_time(photoslib, suspend_capture, output_file):
+def test_pull_exif_no_time(photoslib, suspend_capture, output_file, runner):
     """Test --pull-exif when photo has invalid date/time in EXIF"""
     pre_test = TEST_DATA["pull_exif_no_time"]["pre"]
     post_test = TEST_DATA["pull_exif_no_time"]["post"]
 
-    from photos_time_warp.cli import cli
-
-    runner = CliRunner()
-
     result = runner.invoke(
         cli,
-        ["--compare-exif", "--plain", "-o", output_file],
+        compare_exif_args(output_file),
         terminal_width=TERMINAL_WIDTH,
     )
     output_values = parse_compare_exif(output_file)
@@ -481,7 +457,7 @@ def test_pull_exif_no_time(photoslib, suspend_capture, output_file):
 
     result = runner.invoke(
         cli,
-        ["--compare-exif", "--plain", "-o", output_file],
+        compare_exif_args(output_file),
         terminal_width=TERMINAL_WIDTH,
     )
     output_values = parse_compare_exif(output_file)
@@ -493,18 +469,14 @@ def test_select_marigolds(photoslib, suspend_capture):
     assert ask_user_to_make_selection(photoslib, suspend_capture, "marigold flowers")
 
 
-def test_pull_exif_no_offset(photoslib, suspend_capture, output_file):
+def test_pull_exif_no_offset(photoslib, suspend_capture, output_file, runner):
     """Test --pull-exif when photo has no offset in EXIF"""
     pre_test = TEST_DATA["pull_exif_no_offset"]["pre"]
     post_test = TEST_DATA["pull_exif_no_offset"]["post"]
 
-    from photos_time_warp.cli import cli
-
-    runner = CliRunner()
-
     result = runner.invoke(
         cli,
-        ["--compare-exif", "--plain", "-o", output_file],
+        compare_exif_args(output_file),
         terminal_width=TERMINAL_WIDTH,
     )
     output_values = parse_compare_exif(output_file)
@@ -523,7 +495,7 @@ def test_pull_exif_no_offset(photoslib, suspend_capture, output_file):
 
     result = runner.invoke(
         cli,
-        ["--compare-exif", "--plain", "-o", output_file],
+        compare_exif_args(output_file),
         terminal_width=TERMINAL_WIDTH,
     )
     output_values = parse_compare_exif(output_file)
@@ -537,18 +509,14 @@ def test_select_zinnias(photoslib, suspend_capture):
     )
 
 
-def test_pull_exif_no_data(photoslib, suspend_capture, output_file):
+def test_pull_exif_no_data(photoslib, suspend_capture, output_file, runner):
     """Test --pull-exif when photo has no data in EXIF"""
     pre_test = TEST_DATA["pull_exif_no_data"]["pre"]
     post_test = TEST_DATA["pull_exif_no_data"]["post"]
 
-    from photos_time_warp.cli import cli
-
-    runner = CliRunner()
-
     result = runner.invoke(
         cli,
-        ["--compare-exif", "--plain", "-o", output_file],
+        compare_exif_args(output_file),
         terminal_width=TERMINAL_WIDTH,
     )
     output_values = parse_compare_exif(output_file)
@@ -568,24 +536,23 @@ def test_pull_exif_no_data(photoslib, suspend_capture, output_file):
 
     result = runner.invoke(
         cli,
-        ["--compare-exif", "--plain", "-o", output_file],
+        compare_exif_args(output_file),
         terminal_width=TERMINAL_WIDTH,
     )
     output_values = parse_compare_exif(output_file)
     assert output_values[0] == post_test
 
-def test_pull_exif_no_data_use_file_time(photoslib, suspend_capture, output_file):
+
+def test_pull_exif_no_data_use_file_time(
+    photoslib, suspend_capture, output_file, runner
+):
     """Test --pull-exif when photo has no data in EXIF with --use-file-time"""
     pre_test = TEST_DATA["pull_exif_no_data_use_file_time"]["pre"]
     post_test = TEST_DATA["pull_exif_no_data_use_file_time"]["post"]
 
-    from photos_time_warp.cli import cli
-
-    runner = CliRunner()
-
     result = runner.invoke(
         cli,
-        ["--compare-exif", "--plain", "-o", output_file],
+        compare_exif_args(output_file),
         terminal_width=TERMINAL_WIDTH,
     )
     output_values = parse_compare_exif(output_file)
@@ -606,25 +573,21 @@ def test_pull_exif_no_data_use_file_time(photoslib, suspend_capture, output_file
 
     result = runner.invoke(
         cli,
-        ["--compare-exif", "--plain", "-o", output_file],
+        compare_exif_args(output_file),
         terminal_width=TERMINAL_WIDTH,
     )
     output_values = parse_compare_exif(output_file)
     assert output_values[0] == post_test
 
 
-
 def test_select_sunset_video(photoslib, suspend_capture):
     """Force user to select the right photo for following tests"""
     assert ask_user_to_make_selection(photoslib, suspend_capture, "sunset", video=True)
 
 
 @pytest.mark.parametrize("expected", TEST_DATA["compare_video_1"]["expected"])
-def test_video_compare_exif(photoslib, suspend_capture, expected, output_file):
+def test_video_compare_exif(photoslib, suspend_capture, expected, output_file, runner):
     """Test --compare-exif with video"""
-    from photos_time_warp.cli import cli
-
-    runner = CliRunner()
     result = runner.invoke(
         cli,
         [
@@ -644,12 +607,9 @@ def test_video_compare_exif(photoslib, suspend_capture, expected, output_file):
     "input_value,expected", TEST_DATA["video_date_delta"]["parameters"]
 )
 def test_video_date_delta(
-    photoslib, suspend_capture, input_value, expected, output_file
+    photoslib, suspend_capture, input_value, expected, output_file, runner
 ):
     """Test --date-delta with video"""
-    from photos_time_warp.cli import cli
-
-    runner = CliRunner()
     result = runner.invoke(
         cli,
         [
@@ -663,7 +623,7 @@ def test_video_date_delta(
 
     result = runner.invoke(
         cli,
-        ["--inspect", "--plain", "-o", output_file],
+        inspect_args(output_file),
         terminal_width=TERMINAL_WIDTH,
     )
     output_values = parse_inspect_output(output_file)
@@ -674,12 +634,9 @@ def test_video_date_delta(
     "input_value,expected", TEST_DATA["video_time_delta"]["parameters"]
 )
 def test_video_time_delta(
-    photoslib, suspend_capture, input_value, expected, output_file
+    photoslib, suspend_capture, input_value, expected, output_file, runner
 ):
     """Test --time-delta with video"""
-    from photos_time_warp.cli import cli
-
-    runner = CliRunner()
     result = runner.invoke(
         cli,
         [
@@ -692,7 +649,7 @@ def test_video_time_delta(
     assert result.exit_code == 0
     result = runner.invoke(
         cli,
-        ["--inspect", "--plain", "-o", output_file],
+        inspect_args(output_file),
         terminal_width=TERMINAL_WIDTH,
     )
     output_values = parse_inspect_output(output_file)
@@ -700,11 +657,10 @@ def test_video_time_delta(
 
 
 @pytest.mark.parametrize("input_value,expected", TEST_DATA["video_date"]["parameters"])
-def test_video_date(photoslib, suspend_capture, input_value, expected, output_file):
+def test_video_date(
+    photoslib, suspend_capture, input_value, expected, output_file, runner
+):
     """Test --date with video"""
-    from photos_time_warp.cli import cli
-
-    runner = CliRunner()
     result = runner.invoke(
         cli,
         [
@@ -719,7 +675,7 @@ def test_video_date(photoslib, suspend_capture, input_value, expected, output_fi
     # don't use photo.date as it will return local time instead of the time in the timezone
     result = runner.invoke(
         cli,
-        ["--inspect", "--plain", "-o", output_file],
+        inspect_args(output_file),
         terminal_width=TERMINAL_WIDTH,
     )
     output_values = parse_inspect_output(output_file)
@@ -727,11 +683,10 @@ def test_video_date(photoslib, suspend_capture, input_value, expected, output_fi
 
 
 @pytest.mark.parametrize("input_value,expected", TEST_DATA["video_time"]["parameters"])
-def test_video_time(photoslib, suspend_capture, input_value, expected, output_file):
+def test_video_time(
+    photoslib, suspend_capture, input_value, expected, output_file, runner
+):
     """Test --time with video"""
-    from photos_time_warp.cli import cli
-
-    runner = CliRunner()
     result = runner.invoke(
         cli,
         [
@@ -746,7 +701,7 @@ def test_video_time(photoslib, suspend_capture, input_value, expected, output_fi
     # don't use photo.date as it will return local time instead of the time in the timezone
     result = runner.invoke(
         cli,
-        ["--inspect", "--plain", "-o", output_file],
+        inspect_args(output_file),
         terminal_width=TERMINAL_WIDTH,
     )
     output_values = parse_inspect_output(output_file)
@@ -757,12 +712,15 @@ def test_video_time(photoslib, suspend_capture, input_value, expected, output_fi
     "input_value,expected_date,expected_tz", TEST_DATA["video_time_zone"]["parameters"]
 )
 def test_video_time_zone(
-    photoslib, suspend_capture, input_value, expected_date, expected_tz, output_file
+    photoslib,
+    suspend_capture,
+    input_value,
+    expected_date,
+    expected_tz,
+    output_file,
+    runner,
 ):
     """Test --time-zone"""
-    from photos_time_warp.cli import cli
-
-    runner = CliRunner()
     result = runner.invoke(
         cli,
         [
@@ -774,7 +732,7 @@ def test_video_time_zone(
     )
     assert result.exit_code == 0
     result = runner.invoke(
-        cli, ["--inspect", "--plain", "-o", output_file], terminal_width=TERMINAL_WIDTH
+        cli, inspect_args(output_file), terminal_width=TERMINAL_WIDTH
     )
     output_values = parse_inspect_output(output_file)
     assert output_values[0].date_tz == expected_date
@@ -782,11 +740,10 @@ def test_video_time_zone(
 
 
 @pytest.mark.parametrize("input_value,expected", TEST_DATA["video_match"]["parameters"])
-def test_video_match(photoslib, suspend_capture, input_value, expected, output_file):
+def test_video_match(
+    photoslib, suspend_capture, input_value, expected, output_file, runner
+):
     """Test --timezone --match with video"""
-    from photos_time_warp.cli import cli
-
-    runner = CliRunner()
     result = runner.invoke(
         cli,
         [
@@ -800,25 +757,21 @@ def test_video_match(photoslib, suspend_capture, input_value, expected, output_f
     assert result.exit_code == 0
     result = runner.invoke(
         cli,
-        ["--inspect", "--plain", "-o", output_file],
+        inspect_args(output_file),
         terminal_width=TERMINAL_WIDTH,
     )
     output_values = parse_inspect_output(output_file)
     assert output_values[0].date_tz == expected
 
 
-def test_video_push_exif(photoslib, suspend_capture, output_file):
+def test_video_push_exif(photoslib, suspend_capture, output_file, runner):
     """Test --push-exif with video"""
     pre_test = TEST_DATA["video_push_exif"]["pre"]
     post_test = TEST_DATA["video_push_exif"]["post"]
 
-    from photos_time_warp.cli import cli
-
-    runner = CliRunner()
-
     result = runner.invoke(
         cli,
-        ["--compare-exif", "--plain", "-o", output_file],
+        compare_exif_args(output_file),
         terminal_width=TERMINAL_WIDTH,
     )
     output_values = parse_compare_exif(output_file)
@@ -837,22 +790,18 @@ def test_video_push_exif(photoslib, suspend_capture, output_file):
 
     result = runner.invoke(
         cli,
-        ["--compare-exif", "--plain", "-o", output_file],
+        compare_exif_args(output_file),
         terminal_width=TERMINAL_WIDTH,
     )
     output_values = parse_compare_exif(output_file)
     assert output_values[0] == post_test
 
 
-def test_video_pull_exif(photoslib, suspend_capture, output_file):
+def test_video_pull_exif(photoslib, suspend_capture, output_file, runner):
     """Test --pull-exif with video"""
     pre_test = TEST_DATA["video_pull_exif"]["pre"]
     post_test = TEST_DATA["video_pull_exif"]["post"]
 
-    from photos_time_warp.cli import cli
-
-    runner = CliRunner()
-
     # update the photo so we know if the data is updated
     result = runner.invoke(
         cli,
@@ -863,7 +812,7 @@ def test_video_pull_exif(photoslib, suspend_capture, output_file):
 
     result = runner.invoke(
         cli,
-        ["--compare-exif", "--plain", "-o", output_file],
+        compare_exif_args(output_file),
         terminal_width=TERMINAL_WIDTH,
     )
     output_values = parse_compare_exif(output_file)
@@ -882,7 +831,7 @@ def test_video_pull_exif(photoslib, suspend_capture, output_file):
 
     result = runner.invoke(
         cli,
-        ["--compare-exif", "--plain", "-o", output_file],
+        compare_exif_args(output_file),
         terminal_width=TERMINAL_WIDTH,
     )
     output_values = parse_compare_exif(output_file)
@@ -0,0 +1,34 @@
+""" Tests for sqlite_native which don't require Photos """
+
+import sqlite3
+
+import pytest
+
+from photos_time_warp.sqlite_native import Connection
+
+
+@pytest.fixture
+def db_file(tmp_path):
+    db_file = str(tmp_path / "test.db")
+    conn = sqlite3.connect(db_file)
+    conn.execute("CREATE TABLE test (a INTEGER, b TEXT)")
+    conn.execute("INSERT INTO test VALUES (1, 'one')")
+    conn.commit()
+    conn.close()
+    return db_file
+
+
+def test_connection_query(db_file):
+    """Test Connection.query returns rows"""
+    with Connection(db_file) as conn:
+        rows = conn.query("SELECT a, b FROM test")
+        assert [(row.a, row.b) for row in rows] == [(1, "one")]
+
+
+def test_connection_bad_column_name(db_file):
+    """Test Connection finalizes the statement if a row can't be built for it so the
+    database can still be closed"""
+    conn = Connection(db_file)
+    with pytest.raises(ValueError):
+        conn.query("SELECT count(*) FROM test")
+    conn.close()
@@ -0,0 +1,72 @@
+""" Tests for timeutils which don't require Photos """
+
+import pytest
+
+from photos_time_warp.timeutils import parse_time_offset
+
+# (value, expected seconds); these match what pytimeparse, which parse_time_offset replaced, returns
+PARSE_TIME_OFFSET_VALID = [
+    ("1 hour", 3600),
+    ("1 hours", 3600),
+    ("1 hr", 3600),
+    ("1h", 3600),
+    ("+1 hour", 3600),
+    ("-1 hour", -3600),
+    ("- 1 hour", -3600),
+    ("3 min", 180),
+    ("3 minutes", 180),
+    ("-6 min", -360),
+    ("+10 sec", 10),
+    ("10 s", 10),
+    ("1 week", 604800),
+    ("1 day", 86400),
+    ("-1 day", -86400),
+    ("1 week, 2 days", 777600),
+    ("1 week 2 days", 777600),
+    ("1 day,  2 hours", 93600),
+    ("1 day 2 hours 3 minutes 4 seconds", 93784),
+    ("1h30m", 5400),
+    ("1h 30m", 5400),
+    ("1.5 hours", 5400),
+    ("1 day 2:30:00", 95400),
+    ("1 week 2:30:00", 613800),
+    ("1:10:20", 4220),
+    ("-1:10:20", -4220),
+    ("1:02:03.5", 3723.5),
+    ("2:01:02:03", 176523),
+    ("30:00", 1800),
+    ("1:30", 90),
+    (":30", 30),
+]
+
+# values that can't be parsed; bare numbers are handled by the caller as days or seconds
+PARSE_TIME_OFFSET_INVALID = [
+    "",
+    "+",
+    "1",
+    "-1",
+    "+1",
+    "abc",
+    "1 fortnight",
+    "2 hours 1 day",
+    "30m 1h",
+    "1 hour 2:30:00",
+    "1 day 2:30",
+    "1h30",
+    "1.2.3 hours",
+    "1:2:3",
+    "123:45",
+    "1:30:00:00:00",
+]
+
+
+@pytest.mark.parametrize("value,expected", PARSE_TIME_OFFSET_VALID)
+def test_parse_time_offset(value, expected):
+    """Test parse_time_offset with valid offsets"""
+    assert parse_time_offset(value) == expected
+
+
+@pytest.mark.parametrize("value", PARSE_TIME_OFFSET_INVALID)
+def test_parse_time_offset_invalid(value):
+    """Test parse_time_offset returns None for offsets it can't parse"""
+    assert parse_time_offset(value) is None